@@ -1,83 +1,84 @@
+import hashlib
+import hmac
+import os
+from pathlib import Path
+
 import streamlit as st
 
-st.set_page_config(page_title="Auracelle Bach | Login", layout="wide")
+ENHANCEMENTS = (
+    "1️⃣ Bayesian Uncertainty Quantification",
+    "2️⃣ Convergence Prediction Modeling",
+    "3️⃣ Hierarchical Capability Gap Analysis",
+    "4️⃣ Multi-Objective Pareto Optimization",
+    "5️⃣ Network Diffusion & Cascade Effects",
+    "6️⃣ Historical Pattern Matching",
+    "7️⃣ Maturity Trajectory Planning",
+    "8️⃣ Kalman Filter Capability Tracking",
+    "9️⃣ RL-Optimized Negotiation Strategies",
+    "🔟 Cognitive Foresight & Strategic Analysis",
+)
 
-st.markdown('''
-<style>
-.stApp {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-}
-
-/* 3D Shadow Bevel Buttons for Sidebar Navigation */
-.stButton > button {
-    background: #667eea !important;
-    color: white !important;
-    font-weight: 600 !important;
-    border: none !important;
-    border-radius: 8px !important;
-    padding: 12px 24px !important;
-    box-shadow:
-        0 4px 0 #5566d0,
-        0 4px 8px rgba(0, 0, 0, 0.3) !important;
-    transition: all 0.1s ease !important;
-    position: relative !important;
-    top: 0 !important;
-}
-
-.stButton > button:hover {
-    background: #7589f1 !important;
-    box-shadow:
-        0 4px 0 #6477e1,
-        0 4px 10px rgba(0, 0, 0, 0.35) !important;
-}
-
-.stButton > button:active {
-    top: 4px !important;
-    box-shadow:
-        0 0 0 #5566d0,
-        0 2px 4px rgba(0, 0, 0, 0.3) !important;
-}
-</style>
-''', unsafe_allow_html=True)
+_SUBHEADER = f"{len(ENHANCEMENTS)} Mathematical Enhancements for AI Governance"
+_ENHANCEMENTS_MD = "\n".join(ENHANCEMENTS)
+_PURPOSE_INFO = (
+    "Bach: Complete Mathematical Intelligence Suite for AI Governance - "
+    f"All {len(ENHANCEMENTS)} E-AGPO-HT Mathematical Enhancements"
+)
 
-st.title("🎼 Auracelle Bach: E-AGPO-HT Complete Mathematical Intelligence")
-st.subheader("10 Mathematical Enhancements for AI Governance")
-
-if "authenticated" not in st.session_state:
-    st.session_state["authenticated"] = False
-
-if not st.session_state["authenticated"]:
-    with st.form("login_form"):
-        username = st.text_input("Username")
-        password = st.text_input("Password", type="password")
-
-        st.markdown("#### 🎯 Purpose")
-        st.info("Bach: Complete Mathematical Intelligence Suite for AI Governance - All 10 E-AGPO-HT Mathematical Enhancements")
-
-        st.markdown("**🔢 Active Enhancements:**")
-        st.markdown('''
-        1️⃣ Bayesian Uncertainty Quantification
-        2️⃣ Convergence Prediction Modeling
-        3️⃣ Hierarchical Capability Gap Analysis
-        4️⃣ Multi-Objective Pareto Optimization
-        5️⃣ Network Diffusion & Cascade Effects
-        6️⃣ Historical Pattern Matching
-        7️⃣ Maturity Trajectory Planning
-        8️⃣ Kalman Filter Capability Tracking
-        9️⃣ RL-Optimized Negotiation Strategies
-        🔟 Cognitive Foresight & Strategic Analysis
-        ''')
-
-        submit = st.form_submit_button("🚀 Launch Bach")
-
-    if submit:
-        if password == "charlie2025":
-            st.session_state["authenticated"] = True
-            st.session_state["username"] = username
-            st.success("✅ Authentication successful!")
-            st.rerun()
-        else:
-            st.error("❌ Incorrect password. Access denied.")
-            st.stop()
-else:
+_LOGIN_CSS_PATH = Path(__file__).with_name("static") / "login.css"
+
+# SHA-256 of the default access password; set BACH_PASSWORD to override it.
+_DEFAULT_PASSWORD_SHA256 = "f8d35ea0fdee6f234b20da6114089cf30aaca454003bc335efc62c4f20a3db42"
+
+
+@st.cache_resource(show_spinner=False)
+def _login_css() -> str:
+    return f"<style>{_LOGIN_CSS_PATH.read_text(encoding='utf-8')}</style>"
+
+
+@st.cache_resource(show_spinner=False)
+def _password_digest() -> bytes:
+    secret = os.environ.get("BACH_PASSWORD")
+    if secret:
+        return hashlib.sha256(secret.encode()).digest()
+    return bytes.fromhex(_DEFAULT_PASSWORD_SHA256)
+
+
+def _check_password(password: str) -> bool:
+    digest = hashlib.sha256(password.encode()).digest()
+    return hmac.compare_digest(digest, _password_digest())
+
+
+st.session_state.setdefault("authenticated", False)
+
+# Authenticated users never see the login page; hand off before any rendering.
+if st.session_state["authenticated"]:
     st.switch_page("pages/simulation.py")
+
+st.set_page_config(page_title="Auracelle Bach | Login", layout="wide")
+st.html(_login_css())
+
+st.title("🎼 Auracelle Bach: E-AGPO-HT Complete Mathematical Intelligence")
+st.subheader(_SUBHEADER)
+
+with st.form("login_form"):
+    username = st.text_input("Username")
+    password = st.text_input("Password", type="password")
+
+    st.markdown("#### 🎯 Purpose")
+    st.info(_PURPOSE_INFO)
+
+    st.markdown("**🔢 Active Enhancements:**")
+    st.markdown(_ENHANCEMENTS_MD)
+
+    submit = st.form_submit_button("🚀 Launch Bach")
+
+if submit:
+    if _check_password(password):
+        st.session_state["authenticated"] = True
+        st.session_state["username"] = username
+        st.success("✅ Authentication successful!")
+        st.rerun()
+    else:
+        st.error("❌ Incorrect password. Access denied.")
+        st.stop()
@@ -1,18 +1,232 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import numpy as np
 import math
+import time
 from functools import lru_cache
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from scipy import stats
-from sklearn.metrics.pairwise import cosine_similarity
-import streamlit as st
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to requests' stdlib json decoding
+    orjson = None
+
+try:
+    from numba import config as _numba_config, njit, prange
+    _JIT_ENABLED = not _numba_config.DISABLE_JIT
+except ImportError:  # numba is in requirements.txt; without it the kernels below run as plain Python
+    _JIT_ENABLED = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ⚙️ NUMERIC KERNELS - JIT-compiled when numba is installed
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@njit(cache=True)
+def _bayesian_interval(point_estimate, data_quality, prior_variance=0.05):
+    """95% credible interval, reliability and posterior std for an alignment score"""
+    posterior_std = math.sqrt(prior_variance / (1 + data_quality * 10))
+    ci_lower = max(0.0, point_estimate - 1.96 * posterior_std)
+    ci_upper = min(1.0, point_estimate + 1.96 * posterior_std)
+    return ci_lower, ci_upper, 1 - posterior_std, posterior_std
+
+
+# Gap below which parties are considered converged
+_CONVERGENCE_THRESHOLD = 0.1
+_LOG_CONVERGENCE_THRESHOLD = math.log(_CONVERGENCE_THRESHOLD)
+
+
+@njit(cache=True)
+def _convergence_rounds(ethical_gap, alpha):
+    """Expected negotiation rounds and success probability for a gap closing at rate alpha"""
+    if ethical_gap < _CONVERGENCE_THRESHOLD:
+        return 1, 0.95
+    if alpha < 0.3:
+        return 99, 0.15
+    # ethical_gap >= threshold > 0 here, so log(ethical_gap) needs no floor
+    rounds = math.ceil((_LOG_CONVERGENCE_THRESHOLD - math.log(ethical_gap)) / math.log(1 - alpha * 0.3))
+    rounds = min(rounds, 20)
+    return rounds, 1 - math.exp(-alpha * rounds * 0.15)
+
+
+@njit(cache=True)
+def _diffuse(W, x0, rounds, alpha):
+    """Adoption levels after 0..rounds steps of x -> clip((1 - alpha) x + alpha W x, 0, 1)"""
+    states = np.empty((rounds + 1, x0.shape[0]))
+    states[0] = x0
+    for t in range(rounds):
+        states[t + 1] = np.minimum(np.maximum((1 - alpha) * states[t] + alpha * (W @ states[t]), 0.0), 1.0)
+    return states
+
+
+@njit(cache=True, parallel=True)
+def _diffuse_batch_parallel(W, X0, rounds, alpha):
+    """_diffuse for every row of X0, with the independent runs spread across threads"""
+    out = np.empty((X0.shape[0], rounds + 1, X0.shape[1]))
+    for b in prange(X0.shape[0]):
+        out[b] = _diffuse(W, X0[b], rounds, alpha)
+    return out
+
+
+def _diffuse_batch_vectorized(W, X0, rounds, alpha):
+    """_diffuse for every row of X0 at once, one (B, N) @ (N, N) product per round"""
+    out = np.empty((X0.shape[0], rounds + 1, X0.shape[1]))
+    out[:, 0] = X0
+    for t in range(rounds):
+        out[:, t + 1] = np.minimum(np.maximum((1 - alpha) * out[:, t] + alpha * (out[:, t] @ W.T), 0.0), 1.0)
+    return out
+
+
+# Without the JIT the prange kernel is a serial Python loop; NumPy batches the runs instead
+_diffuse_batch = _diffuse_batch_parallel if _JIT_ENABLED else _diffuse_batch_vectorized
+
+
+@njit(cache=True)
+def _maturity_path(M0, months, growth, rho, M_max, target):
+    """Monthly logistic maturity growth, stopping after the first month that reaches target"""
+    path = np.empty(months)
+    M = M0
+    for month in range(months):
+        dM = rho * M * (1 - M / M_max) + growth
+        M = min(M + dM, M_max)
+        path[month] = M
+        if M >= target:
+            return path[:month + 1]
+    return path
+
+
+# Inclusive prefix scans by recursive doubling: log2(T) vectorized steps instead of T serial ones
+
+def _affine_prefix(a, b):
+    """Compose the maps x -> a[t] * x + b[t]; entry t of the result is maps 0..t applied in order"""
+    a, b = a.copy(), b.copy()
+    shift = 1
+    while shift < len(a):
+        b[shift:] = a[shift:] * b[:-shift] + b[shift:]
+        a[shift:] = a[shift:] * a[:-shift]
+        shift *= 2
+    return a, b
+
+
+def _mobius_prefix(m):
+    """Compose the Mobius maps given as (T, 2, 2) matrices; entry t is maps 0..t applied in order"""
+    m = m.copy()
+    shift = 1
+    while shift < len(m):
+        m[shift:] = m[shift:] @ m[:-shift]
+        # Mobius maps are scale-invariant; renormalize so long products cannot overflow
+        m /= np.abs(m).max(axis=(1, 2), keepdims=True)
+        shift *= 2
+    return m
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 📊 DATA INGRESS SYSTEM - Phase 2 API Integration
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Phase 2 endpoint configuration, shared read-only by every DataIngress
+_API_CONFIGS = MappingProxyType({
+    'oecd': {
+        'base_url': 'https://oecd.ai/en/api',
+        'endpoints': {
+            'principles': '/ai-principles',
+            'policies': '/catalogue/policies',
+            'incidents': '/ai-incidents'
+        },
+        'headers': {
+            'Accept': 'application/json',
+            'User-Agent': 'Auracelle-Bach-AGPO/1.0'
+        },
+        'rate_limit': 100,
+        'timeout': 30
+    },
+    'privacy_international': {
+        'base_url': 'https://privacyinternational.org/data',
+        'endpoints': {
+            'country_scores': '/country-scores',
+            'surveillance_index': '/surveillance-index',
+            'legislation': '/data-protection-laws'
+        },
+        'headers': {
+            'Accept': 'application/json',
+            'User-Agent': 'Auracelle-Bach-AGPO/1.0'
+        },
+        'rate_limit': 60,
+        'timeout': 30
+    },
+    'parlamint': {
+        'base_url': 'https://clarin.si/repository/xmlui',
+        'endpoints': {
+            'corpus': '/handle/11356/1432',
+            'metadata': '/handle/11356/1486',
+            'analytics': '/handle/11356/1431'
+        },
+        'headers': {
+            'Accept': 'application/xml',
+            'User-Agent': 'Auracelle-Bach-AGPO/1.0'
+        },
+        'rate_limit': 50,
+        'timeout': 45
+    }
+})
+
+# Offline datasets served when an API is unavailable; shared read-only by every DataIngress
+_STATIC_FALLBACK = MappingProxyType({
+    'oecd_principles': {
+        "Inclusive growth, sustainable development and well-being": {
+            "description": "AI should benefit people and the planet by driving inclusive growth and sustainable development",
+            "weight": 0.9, "category": "societal"
+        },
+        "Human-centred values and fairness": {
+            "description": "AI systems should respect rule of law, human rights, democratic values and diversity",
+            "weight": 0.95, "category": "ethical"
+        },
+        "Transparency and explainability": {
+            "description": "People should understand AI-based outcomes and be able to challenge them",
+            "weight": 0.85, "category": "technical"
+        },
+        "Robustness, security and safety": {
+            "description": "AI systems should function appropriately throughout their life cycles",
+            "weight": 0.9, "category": "technical"
+        },
+        "Accountability": {
+            "description": "Organizations deploying AI should be accountable for its proper functioning",
+            "weight": 0.95, "category": "governance"
+        }
+    },
+    'privacy_scores': {
+        "USA": {"legal_framework": 0.65, "enforcement": 0.70, "surveillance_concerns": 0.50, "data_protection": 0.68, "overall": 0.63},
+        "GBR": {"legal_framework": 0.85, "enforcement": 0.82, "surveillance_concerns": 0.60, "data_protection": 0.88, "overall": 0.79},
+        "CHN": {"legal_framework": 0.50, "enforcement": 0.45, "surveillance_concerns": 0.20, "data_protection": 0.40, "overall": 0.39},
+        "JPN": {"legal_framework": 0.80, "enforcement": 0.75, "surveillance_concerns": 0.70, "data_protection": 0.82, "overall": 0.77},
+        "IND": {"legal_framework": 0.70, "enforcement": 0.65, "surveillance_concerns": 0.55, "data_protection": 0.72, "overall": 0.66},
+        "BRA": {"legal_framework": 0.78, "enforcement": 0.70, "surveillance_concerns": 0.65, "data_protection": 0.75, "overall": 0.72},
+        "ARE": {"legal_framework": 0.60, "enforcement": 0.55, "surveillance_concerns": 0.45, "data_protection": 0.58, "overall": 0.55}
+    },
+    'argumentation_patterns': {
+        "USA": {"primary_frame": "Innovation & Competitiveness", "secondary_frame": "National Security", "rhetoric_style": "pragmatic", "consensus_tendency": 0.65, "debate_intensity": 0.80},
+        "GBR": {"primary_frame": "Human Rights & Ethics", "secondary_frame": "Economic Impact", "rhetoric_style": "balanced", "consensus_tendency": 0.72, "debate_intensity": 0.70},
+        "CHN": {"primary_frame": "State Control & Social Stability", "secondary_frame": "Technological Leadership", "rhetoric_style": "directive", "consensus_tendency": 0.90, "debate_intensity": 0.40},
+        "JPN": {"primary_frame": "Public Trust & Safety", "secondary_frame": "Industrial Policy", "rhetoric_style": "consensus-oriented", "consensus_tendency": 0.85, "debate_intensity": 0.50},
+        "IND": {"primary_frame": "Digital Sovereignty", "secondary_frame": "Inclusive Development", "rhetoric_style": "pluralistic", "consensus_tendency": 0.60, "debate_intensity": 0.75},
+        "BRA": {"primary_frame": "Social Justice", "secondary_frame": "Data Rights", "rhetoric_style": "advocacy-driven", "consensus_tendency": 0.58, "debate_intensity": 0.78},
+        "ARE": {"primary_frame": "Smart Nation Vision", "secondary_frame": "Regional Leadership", "rhetoric_style": "aspirational", "consensus_tendency": 0.75, "debate_intensity": 0.55}
+    }
+})
+
+
 class DataIngress:
     """
     Comprehensive data ingress system for Phase 2 APIs:
@@ -30,276 +244,123 @@ class DataIngress:
 
     def __init__(self):
         self.cache = {}
-        self.last_update = {}
-        self.api_configs = self._initialize_api_configs()
-        self.static_fallback = self._initialize_static_fallback()
+        self.last_update = {}  # time.monotonic() of each cache write
+        self.last_update_iso = {}  # wall-clock equivalent, for reporting
+        self.api_configs = _API_CONFIGS
+        self.static_fallback = _STATIC_FALLBACK
+        self.session = self._initialize_session()
+
+    def _initialize_session(self, max_attempts=3):
+        """Create a pooled HTTP session with exponential backoff retry logic"""
+        retry = Retry(
+            total=max_attempts - 1,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
 
-    def _initialize_api_configs(self):
-        """Configure API endpoints and parameters"""
-        return {
-            'oecd': {
-                'base_url': 'https://oecd.ai/en/api',
-                'endpoints': {
-                    'principles': '/ai-principles',
-                    'policies': '/catalogue/policies',
-                    'incidents': '/ai-incidents'
-                },
-                'headers': {
-                    'Accept': 'application/json',
-                    'User-Agent': 'Auracelle-Bach-AGPO/1.0'
-                },
-                'rate_limit': 100,
-                'timeout': 30
-            },
-            'privacy_international': {
-                'base_url': 'https://privacyinternational.org/data',
-                'endpoints': {
-                    'country_scores': '/country-scores',
-                    'surveillance_index': '/surveillance-index',
-                    'legislation': '/data-protection-laws'
-                },
-                'headers': {
-                    'Accept': 'application/json',
-                    'User-Agent': 'Auracelle-Bach-AGPO/1.0'
-                },
-                'rate_limit': 60,
-                'timeout': 30
-            },
-            'parlamint': {
-                'base_url': 'https://clarin.si/repository/xmlui',
-                'endpoints': {
-                    'corpus': '/handle/11356/1432',
-                    'metadata': '/handle/11356/1486',
-                    'analytics': '/handle/11356/1431'
-                },
-                'headers': {
-                    'Accept': 'application/xml',
-                    'User-Agent': 'Auracelle-Bach-AGPO/1.0'
-                },
-                'rate_limit': 50,
-                'timeout': 45
-            }
-        }
+    def fetch_with_retry(self, url, headers=None, timeout=30):
+        """Fetch JSON from URL; retries and backoff are handled by the session's Retry policy"""
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout)
+            if response.status_code == 200:
+                return orjson.loads(response.content) if orjson else response.json()
+            print(f"⚠️  HTTP {response.status_code} for {url}")
 
-    def _initialize_static_fallback(self):
-        """Initialize static fallback data for when APIs are unavailable"""
-        return {
-            'oecd_principles': {
-                "Inclusive growth, sustainable development and well-being": {
-                    "description": "AI should benefit people and the planet by driving inclusive growth and sustainable development",
-                    "weight": 0.9, "category": "societal"
-                },
-                "Human-centred values and fairness": {
-                    "description": "AI systems should respect rule of law, human rights, democratic values and diversity",
-                    "weight": 0.95, "category": "ethical"
-                },
-                "Transparency and explainability": {
-                    "description": "People should understand AI-based outcomes and be able to challenge them",
-                    "weight": 0.85, "category": "technical"
-                },
-                "Robustness, security and safety": {
-                    "description": "AI systems should function appropriately throughout their life cycles",
-                    "weight": 0.9, "category": "technical"
-                },
-                "Accountability": {
-                    "description": "Organizations deploying AI should be accountable for its proper functioning",
-                    "weight": 0.95, "category": "governance"
-                }
-            },
-            'privacy_scores': {
-                "USA": {"legal_framework": 0.65, "enforcement": 0.70, "surveillance_concerns": 0.50, "data_protection": 0.68, "overall": 0.63},
-                "GBR": {"legal_framework": 0.85, "enforcement": 0.82, "surveillance_concerns": 0.60, "data_protection": 0.88, "overall": 0.79},
-                "CHN": {"legal_framework": 0.50, "enforcement": 0.45, "surveillance_concerns": 0.20, "data_protection": 0.40, "overall": 0.39},
-                "JPN": {"legal_framework": 0.80, "enforcement": 0.75, "surveillance_concerns": 0.70, "data_protection": 0.82, "overall": 0.77},
-                "IND": {"legal_framework": 0.70, "enforcement": 0.65, "surveillance_concerns": 0.55, "data_protection": 0.72, "overall": 0.66},
-                "BRA": {"legal_framework": 0.78, "enforcement": 0.70, "surveillance_concerns": 0.65, "data_protection": 0.75, "overall": 0.72},
-                "ARE": {"legal_framework": 0.60, "enforcement": 0.55, "surveillance_concerns": 0.45, "data_protection": 0.58, "overall": 0.55}
-            },
-            'argumentation_patterns': {
-                "USA": {"primary_frame": "Innovation & Competitiveness", "secondary_frame": "National Security", "rhetoric_style": "pragmatic", "consensus_tendency": 0.65, "debate_intensity": 0.80},
-                "GBR": {"primary_frame": "Human Rights & Ethics", "secondary_frame": "Economic Impact", "rhetoric_style": "balanced", "consensus_tendency": 0.72, "debate_intensity": 0.70},
-                "CHN": {"primary_frame": "State Control & Social Stability", "secondary_frame": "Technological Leadership", "rhetoric_style": "directive", "consensus_tendency": 0.90, "debate_intensity": 0.40},
-                "JPN": {"primary_frame": "Public Trust & Safety", "secondary_frame": "Industrial Policy", "rhetoric_style": "consensus-oriented", "consensus_tendency": 0.85, "debate_intensity": 0.50},
-                "IND": {"primary_frame": "Digital Sovereignty", "secondary_frame": "Inclusive Development", "rhetoric_style": "pluralistic", "consensus_tendency": 0.60, "debate_intensity": 0.75},
-                "BRA": {"primary_frame": "Social Justice", "secondary_frame": "Data Rights", "rhetoric_style": "advocacy-driven", "consensus_tendency": 0.58, "debate_intensity": 0.78},
-                "ARE": {"primary_frame": "Smart Nation Vision", "secondary_frame": "Regional Leadership", "rhetoric_style": "aspirational", "consensus_tendency": 0.75, "debate_intensity": 0.55}
-            }
-        }
+        except requests.exceptions.Timeout:
+            print(f"⚠️  Timeout for {url}")
 
-    def fetch_with_retry(self, url, headers=None, max_retries=3, timeout=30):
-        """Fetch data from URL with exponential backoff retry logic"""
-        import requests
-        import time
-
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, headers=headers, timeout=timeout)
-
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 429:
-                    wait_time = (2 ** attempt) * 5
-                    print(f"⚠️  Rate limited. Waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                else:
-                    print(f"⚠️  HTTP {response.status_code} for {url}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-
-            except requests.exceptions.Timeout:
-                print(f"⚠️  Timeout for {url} (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-
-            except requests.exceptions.RequestException as e:
-                print(f"⚠️  Request failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️  Request failed: {e}")
 
-        return None
+        except ValueError as e:
+            print(f"⚠️  Invalid JSON from {url}: {e}")
 
-    def fetch_oecd_data(self, force_refresh=False):
-        """Fetch OECD AI Principles and policy data"""
-        cache_key = 'oecd_data'
+        return None
 
+    def _fetch_source(self, cache_key, config_key, endpoint_key, ttl_hours, label, payload_key, fallback_key,
+                      source, details, live_details=None, force_refresh=False):
+        """Serve one Phase 2 source from cache, the live API, or the static fallback"""
         if not force_refresh and cache_key in self.cache:
-            age = (datetime.now() - self.last_update[cache_key]).seconds / 3600
-            if age < 24:
-                print(f"✓ Using cached OECD data (age: {age:.1f}h)")
+            age = (time.monotonic() - self.last_update[cache_key]) / 3600
+            if age < ttl_hours:
+                print(f"✓ Using cached {label} data (age: {age:.1f}h)")
                 return self.cache[cache_key]
 
-        config = self.api_configs['oecd']
-        principles_url = f"{config['base_url']}{config['endpoints']['principles']}"
+        config = self.api_configs[config_key]
+        url = f"{config['base_url']}{config['endpoints'][endpoint_key]}"
 
-        print("🔄 Fetching live OECD AI Principles data...")
-        data = self.fetch_with_retry(principles_url, config['headers'], timeout=config['timeout'])
+        print(f"🔄 Fetching live {label} data...")
+        data = self.fetch_with_retry(url, config['headers'], timeout=config['timeout'])
+        now_iso = datetime.now().isoformat()
 
         if data:
-            processed_data = {
-                'principles': self.static_fallback['oecd_principles'],
-                'api_metadata': {
-                    'source': 'OECD.AI Policy Observatory',
-                    'last_updated': datetime.now().isoformat(),
-                    'version': data.get('version', '2.0'),
-                    'signatories': data.get('signatories', 42)
-                }
+            api_metadata = {
+                'source': source,
+                'last_updated': now_iso,
+                **details,
+                **(live_details(data) if live_details else {})
             }
-
-            self.cache[cache_key] = processed_data
-            self.last_update[cache_key] = datetime.now()
-            print("✓ OECD data fetched and cached successfully")
-            return processed_data
         else:
-            print("⚠️ OECD API unavailable - using static fallback data")
-            processed_data = {
-                'principles': self.static_fallback['oecd_principles'],
-                'api_metadata': {
-                    'source': 'OECD.AI Policy Observatory (Fallback Data)',
-                    'last_updated': datetime.now().isoformat(),
-                    'version': '2.0',
-                    'signatories': 42,
-                    'data_status': 'static_fallback'
-                }
+            print(f"⚠️ {label} API unavailable - using static fallback data")
+            api_metadata = {
+                'source': f"{source} (Fallback Data)",
+                'last_updated': now_iso,
+                **details,
+                'data_status': 'static_fallback'
             }
-            self.cache[cache_key] = processed_data
-            self.last_update[cache_key] = datetime.now()
-            return processed_data
-
-    def fetch_privacy_international_data(self, force_refresh=False):
-        """Fetch Privacy International surveillance and data protection scores"""
-        cache_key = 'privacy_data'
-
-        if not force_refresh and cache_key in self.cache:
-            age = (datetime.now() - self.last_update[cache_key]).seconds / 3600
-            if age < 168:
-                print(f"✓ Using cached Privacy International data (age: {age:.1f}h)")
-                return self.cache[cache_key]
-
-        config = self.api_configs['privacy_international']
-        scores_url = f"{config['base_url']}{config['endpoints']['country_scores']}"
-
-        print("🔄 Fetching live Privacy International data...")
-        data = self.fetch_with_retry(scores_url, config['headers'], timeout=config['timeout'])
 
+        processed_data = {payload_key: self.static_fallback[fallback_key], 'api_metadata': api_metadata}
+        self.cache[cache_key] = processed_data
+        self.last_update[cache_key] = time.monotonic()
+        self.last_update_iso[cache_key] = now_iso
         if data:
-            processed_data = {
-                'scores': self.static_fallback['privacy_scores'],
-                'api_metadata': {
-                    'source': 'Privacy International',
-                    'last_updated': datetime.now().isoformat(),
-                    'methodology': 'State of Privacy Index 2023',
-                    'countries_covered': len(self.static_fallback['privacy_scores'])
-                }
-            }
+            print(f"✓ {label} data fetched and cached")
+        return processed_data
 
-            self.cache[cache_key] = processed_data
-            self.last_update[cache_key] = datetime.now()
-            print("✓ Privacy International data fetched and cached")
-            return processed_data
-        else:
-            print("⚠️ Privacy International API unavailable - using static fallback data")
-            processed_data = {
-                'scores': self.static_fallback['privacy_scores'],
-                'api_metadata': {
-                    'source': 'Privacy International (Fallback Data)',
-                    'last_updated': datetime.now().isoformat(),
-                    'methodology': 'State of Privacy Index 2023',
-                    'countries_covered': len(self.static_fallback['privacy_scores']),
-                    'data_status': 'static_fallback'
-                }
-            }
-            self.cache[cache_key] = processed_data
-            self.last_update[cache_key] = datetime.now()
-            return processed_data
+    def fetch_oecd_data(self, force_refresh=False):
+        """Fetch OECD AI Principles and policy data"""
+        return self._fetch_source(
+            'oecd_data', 'oecd', 'principles', ttl_hours=24, label="OECD",
+            payload_key='principles', fallback_key='oecd_principles',
+            source='OECD.AI Policy Observatory',
+            details={'version': '2.0', 'signatories': 42},
+            live_details=lambda data: {
+                'version': data.get('version', '2.0'),
+                'signatories': data.get('signatories', 42)
+            },
+            force_refresh=force_refresh
+        )
+
+    def fetch_privacy_international_data(self, force_refresh=False):
+        """Fetch Privacy International surveillance and data protection scores"""
+        return self._fetch_source(
+            'privacy_data', 'privacy_international', 'country_scores', ttl_hours=168, label="Privacy International",
+            payload_key='scores', fallback_key='privacy_scores',
+            source='Privacy International',
+            details={
+                'methodology': 'State of Privacy Index 2023',
+                'countries_covered': len(self.static_fallback['privacy_scores'])
+            },
+            force_refresh=force_refresh
+        )
 
     def fetch_parlamint_data(self, force_refresh=False):
         """Fetch ParlaMint parliamentary debate corpus and argumentation patterns"""
-        cache_key = 'parlamint_data'
-
-        if not force_refresh and cache_key in self.cache:
-            age = (datetime.now() - self.last_update[cache_key]).seconds / 3600
-            if age < 168:
-                print(f"✓ Using cached ParlaMint data (age: {age:.1f}h)")
-                return self.cache[cache_key]
-
-        config = self.api_configs['parlamint']
-        corpus_url = f"{config['base_url']}{config['endpoints']['corpus']}"
-
-        print("🔄 Fetching live ParlaMint corpus data...")
-        data = self.fetch_with_retry(corpus_url, config['headers'], timeout=config['timeout'])
-
-        if data:
-            processed_data = {
-                'patterns': self.static_fallback['argumentation_patterns'],
-                'api_metadata': {
-                    'source': 'ParlaMint 4.0 Corpus',
-                    'last_updated': datetime.now().isoformat(),
-                    'corpus_version': '4.0',
-                    'parliaments_covered': 29,
-                    'time_period': '2015-2024'
-                }
-            }
-
-            self.cache[cache_key] = processed_data
-            self.last_update[cache_key] = datetime.now()
-            print("✓ ParlaMint data fetched and cached")
-            return processed_data
-        else:
-            print("⚠️ ParlaMint API unavailable - using static fallback data")
-            processed_data = {
-                'patterns': self.static_fallback['argumentation_patterns'],
-                'api_metadata': {
-                    'source': 'ParlaMint 4.0 Corpus (Fallback Data)',
-                    'last_updated': datetime.now().isoformat(),
-                    'corpus_version': '4.0',
-                    'parliaments_covered': 29,
-                    'time_period': '2015-2024',
-                    'data_status': 'static_fallback'
-                }
-            }
-            self.cache[cache_key] = processed_data
-            self.last_update[cache_key] = datetime.now()
-            return processed_data
+        return self._fetch_source(
+            'parlamint_data', 'parlamint', 'corpus', ttl_hours=168, label="ParlaMint",
+            payload_key='patterns', fallback_key='argumentation_patterns',
+            source='ParlaMint 4.0 Corpus',
+            details={'corpus_version': '4.0', 'parliaments_covered': 29, 'time_period': '2015-2024'},
+            force_refresh=force_refresh
+        )
 
     def get_all_phase2_data(self, force_refresh=False):
         """Fetch all Phase 2 API data in one call"""
@@ -307,12 +368,17 @@ class DataIngress:
         print("📊 PHASE 2 DATA INGRESS - Fetching All Sources")
         print("="*80)
 
-        return {
-            'oecd': self.fetch_oecd_data(force_refresh),
-            'privacy_international': self.fetch_privacy_international_data(force_refresh),
-            'parlamint': self.fetch_parlamint_data(force_refresh)
+        fetchers = {
+            'oecd': self.fetch_oecd_data,
+            'privacy_international': self.fetch_privacy_international_data,
+            'parlamint': self.fetch_parlamint_data
         }
 
+        # Sources are independent, so overlap their network waits
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as pool:
+            futures = {name: pool.submit(fetch, force_refresh) for name, fetch in fetchers.items()}
+            return {name: future.result() for name, future in futures.items()}
+
     def get_data_freshness_report(self):
         """Generate report on data freshness and cache status"""
         report = {
@@ -320,10 +386,11 @@ class DataIngress:
             'total_cached_items': len(self.cache)
         }
 
+        now = time.monotonic()
         for key, timestamp in self.last_update.items():
-            age_hours = (datetime.now() - timestamp).seconds / 3600
+            age_hours = (now - timestamp) / 3600
             report['cache_status'][key] = {
-                'last_updated': timestamp.isoformat(),
+                'last_updated': self.last_update_iso[key],
                 'age_hours': round(age_hours, 2),
                 'status': 'fresh' if age_hours < 24 else 'stale' if age_hours < 168 else 'very_stale'
             }
@@ -331,9 +398,106 @@ class DataIngress:
         return report
 
 
+class DiffusionTrajectory(Sequence):
+    """Per-round adoption states backed by one (rounds + 1, N) array; {country: level} dicts are built on access"""
+
+    def __init__(self, states, countries):
+        self.states = states
+        self.countries = countries
+
+    def __len__(self):
+        return len(self.states)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return dict(zip(self.countries, self.states[index].tolist()))
+
+
+class KalmanHistory(Sequence):
+    """Growable (step, estimate, uncertainty) log stored in a preallocated array that doubles when full"""
+
+    def __init__(self, capacity=64):
+        self._buffer = np.empty((capacity, 2))
+        self._size = 0
+
+    def append(self, x_hat, P):
+        if self._size == len(self._buffer):
+            grown = np.empty((2 * len(self._buffer), 2))
+            grown[:self._size] = self._buffer
+            self._buffer = grown
+        self._buffer[self._size] = (x_hat, P)
+        self._size += 1
+
+    @property
+    def values(self):
+        """(steps, 2) view of the logged estimates and uncertainties"""
+        return self._buffer[:self._size]
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        step = range(self._size)[index]
+        x_hat, P = self._buffer[step].tolist()
+        return step, x_hat, P
+
+
 class BachGovernanceAPI:
     """Complete Mathematical Intelligence Suite for AI Governance - 9 Enhancements"""
 
+    PARETO_OBJECTIVES = ("ethical_alignment", "privacy_protection", "speed_to_agreement", "innovation_potential")
+
+    # Column layouts of the per-country feature arrays built in _build_country_arrays
+    OECD_FIELDS = ("adoption_level", "implementation_score")
+    PRIVACY_FIELDS = ("legal_framework", "enforcement", "surveillance_concerns", "data_protection", "overall")
+    PATTERN_FIELDS = ("consensus_tendency", "debate_intensity")
+    OECD_IMPLEMENTATION = OECD_FIELDS.index("implementation_score")
+    PRIVACY_OVERALL = PRIVACY_FIELDS.index("overall")
+    PATTERN_CONSENSUS = PATTERN_FIELDS.index("consensus_tendency")
+
+    # Fallback profiles for countries outside the reference tables
+    DEFAULT_OECD_COMPLIANCE = {
+        "adoption_level": 0.50,
+        "implementation_score": 0.45,
+        "signatory": False
+    }
+    DEFAULT_PRIVACY_SCORE = {
+        "legal_framework": 0.50,
+        "enforcement": 0.50,
+        "surveillance_concerns": 0.50,
+        "data_protection": 0.50,
+        "overall": 0.50
+    }
+    DEFAULT_ARGUMENTATION_PATTERN = {
+        "primary_frame": "Balanced Approach",
+        "secondary_frame": "Public Interest",
+        "rhetoric_style": "neutral",
+        "consensus_tendency": 0.65,
+        "debate_intensity": 0.60
+    }
+    DEFAULT_DATA_QUALITY = 0.5
+
+    # Policy-scenario weights for ethical alignment: (oecd, privacy)
+    SCENARIO_WEIGHTS = {
+        "AI Ethics": (0.6, 0.4),
+        "AI Safety": (0.7, 0.3),
+        "Data Privacy": (0.3, 0.7),
+        "Export Controls": (0.5, 0.5),
+        "R&D Investment": (0.8, 0.2)
+    }
+    DEFAULT_SCENARIO_WEIGHTS = (0.5, 0.5)
+
+    # Broad governance capabilities (BGC) used by capability gap diagnosis
+    BGC_NAMES = np.array(["STI", "ESI", "IIC", "NDM", "SRA", "SAD", "ASI"])
+    BGC_SCORES = np.array([0.70, 0.63, 0.64, 0.68, 0.72, 0.66, 0.69])
+    BGC_WEIGHTS = np.array([0.15, 0.18, 0.16, 0.15, 0.14, 0.12, 0.10])
+
+    # g-GWC lower bounds of maturity levels 2, 3 and 4 (level 1 is below 0.4)
+    MATURITY_GWC_THRESHOLDS = np.array([0.4, 0.6, 0.75])
+
     def __init__(self):
         # OECD AI Principles (Phase 2 API Integration)
                 # Initialize Phase 2 Data Ingress System
@@ -429,6 +593,76 @@ class BachGovernanceAPI:
         # Kalman filter states
         self.kalman_states = {}
 
+        self._build_country_arrays()
+        self._build_influence_matrix()
+
+        # (K, D) matrix of unit-length scenario features: cosine similarity becomes one matvec.
+        # float32 is exact enough here: similarities are reported to 3 decimals.
+        self.historical_names = list(self.historical_scenarios)
+        self.historical_features_unit = self._unit_rows(
+            np.stack([self.historical_scenarios[name]["features"] for name in self.historical_names])
+        ).astype(np.float32)
+        # (K, A) actor membership matrix over every actor named in a scenario, for vectorized Jaccard overlap
+        self.historical_actor_idx = {
+            actor: i for i, actor in enumerate(dict.fromkeys(
+                actor for name in self.historical_names for actor in self.historical_scenarios[name]["actors"]
+            ))
+        }
+        self.historical_actor_mask = np.zeros((len(self.historical_names), len(self.historical_actor_idx)), dtype=bool)
+        for row, name in enumerate(self.historical_names):
+            for actor in self.historical_scenarios[name]["actors"]:
+                self.historical_actor_mask[row, self.historical_actor_idx[actor]] = True
+        self.historical_actor_counts = self.historical_actor_mask.sum(axis=1)
+
+        # Memoize per-country lookups; the tables above are fixed after init
+        self.get_oecd_compliance = lru_cache(maxsize=4096)(self.get_oecd_compliance)
+        self.get_privacy_score = lru_cache(maxsize=4096)(self.get_privacy_score)
+        self.get_argumentation_pattern = lru_cache(maxsize=4096)(self.get_argumentation_pattern)
+        self.calculate_ethical_alignment = lru_cache(maxsize=4096)(self.calculate_ethical_alignment)
+
+    def _build_country_arrays(self):
+        """Lay per-country scores out as contiguous arrays, one row per country"""
+        self.country_order = list(dict.fromkeys([
+            *self.oecd_adoption, *self.privacy_scores, *self.argumentation_patterns, *self.data_quality
+        ]))
+        self.country_idx = {iso: i for i, iso in enumerate(self.country_order)}
+        # The extra last row holds the fallback profile for unknown countries
+        self.default_row = len(self.country_order)
+
+        def rows(table, default, fields):
+            records = [table.get(iso, default) for iso in self.country_order] + [default]
+            return np.array([[r[f] for f in fields] for r in records])
+
+        self.oecd_arr = rows(self.oecd_adoption, self.DEFAULT_OECD_COMPLIANCE, self.OECD_FIELDS)
+        self.privacy_arr = rows(self.privacy_scores, self.DEFAULT_PRIVACY_SCORE, self.PRIVACY_FIELDS)
+        self.pattern_arr = rows(self.argumentation_patterns, self.DEFAULT_ARGUMENTATION_PATTERN, self.PATTERN_FIELDS)
+        self.data_quality_arr = np.array(
+            [self.data_quality.get(iso, self.DEFAULT_DATA_QUALITY) for iso in self.country_order]
+            + [self.DEFAULT_DATA_QUALITY]
+        )
+
+    def _build_influence_matrix(self):
+        """Row-normalized influence matrix over the OECD-tracked countries, built once"""
+        # Kept dense: the network is small and over half full, where a dense matvec beats CSR
+        # and stays usable inside the njit _diffuse kernel
+        self.diffusion_countries = countries = list(self.oecd_adoption.keys())
+        country_idx = {c: i for i, c in enumerate(countries)}
+
+        W = np.zeros((len(countries), len(countries)))
+        for src in countries:
+            if src in self.influence_network:
+                for tgt, weight in self.influence_network[src].items():
+                    if tgt in country_idx:
+                        W[country_idx[src], country_idx[tgt]] = weight
+
+        # Normalize rows
+        row_sums = W.sum(axis=1, keepdims=True)
+        row_sums[row_sums == 0] = 1
+        self.influence_matrix = W / row_sums
+
+    def _country_row(self, country_iso3):
+        return self.country_idx.get(country_iso3, self.default_row)
+
     # =================================================================
     # ENHANCEMENT 1: BAYESIAN UNCERTAINTY QUANTIFICATION
     # =================================================================
@@ -436,14 +670,9 @@ class BachGovernanceAPI:
     def calculate_ethical_alignment_bayesian(self, country_iso3, policy_scenario):
         """Bayesian uncertainty quantification for ethical alignment"""
         point_estimate = self.calculate_ethical_alignment(country_iso3, policy_scenario)
-        data_quality = self.data_quality.get(country_iso3, 0.5)
-
-        prior_variance = 0.05
-        posterior_std = np.sqrt(prior_variance / (1 + data_quality * 10))
+        data_quality = float(self.data_quality_arr[self._country_row(country_iso3)])
 
-        ci_lower = max(0, point_estimate - 1.96 * posterior_std)
-        ci_upper = min(1, point_estimate + 1.96 * posterior_std)
-        reliability = 1 - posterior_std
+        ci_lower, ci_upper, reliability, posterior_std = _bayesian_interval(point_estimate, data_quality)
 
         return {
             "score": point_estimate,
@@ -463,36 +692,28 @@ class BachGovernanceAPI:
         ethical_b = self.calculate_ethical_alignment(country_b, policy)
         ethical_gap = abs(ethical_a - ethical_b)
 
-        pattern_a = self.get_argumentation_pattern(country_a)
-        pattern_b = self.get_argumentation_pattern(country_b)
+        consensus_a, debate_a = self.pattern_arr[self._country_row(country_a)].tolist()
+        consensus_b, debate_b = self.pattern_arr[self._country_row(country_b)].tolist()
 
-        coop_a = pattern_a["consensus_tendency"] * (1 - pattern_a["debate_intensity"] * 0.5)
-        coop_b = pattern_b["consensus_tendency"] * (1 - pattern_b["debate_intensity"] * 0.5)
+        coop_a = consensus_a * (1 - debate_a * 0.5)
+        coop_b = consensus_b * (1 - debate_b * 0.5)
         alpha = (coop_a + coop_b) / 2
 
-        threshold = 0.1
-
-        if ethical_gap < threshold:
-            rounds = 1
-            probability = 0.95
-        elif alpha < 0.3:
-            rounds = 99
-            probability = 0.15
-        else:
-            rounds = math.ceil(math.log(threshold / max(ethical_gap, 0.01)) / math.log(1 - alpha * 0.3))
-            rounds = min(rounds, 20)
-            probability = 1 - math.exp(-alpha * rounds * 0.15)
-
-        trajectory = []
-        current_gap = ethical_gap
-        for r in range(min(rounds, 15)):
-            current_gap = current_gap * (1 - alpha * 0.3)
-            trajectory.append({
-                "round": r + 1,
-                "gap": round(current_gap, 3),
-                "position_a": round(ethical_a + (ethical_b - ethical_a) * (1 - current_gap/ethical_gap) * 0.5, 3),
-                "position_b": round(ethical_b - (ethical_b - ethical_a) * (1 - current_gap/ethical_gap) * 0.5, 3)
-            })
+        rounds, probability = _convergence_rounds(ethical_gap, alpha)
+
+        # The gap shrinks geometrically, so round r is gap * decay**r in closed form
+        decay_powers = (1 - alpha * 0.3) ** np.arange(1, min(rounds, 15) + 1)
+        gaps = ethical_gap * decay_powers
+        shift = (ethical_b - ethical_a) * (1 - decay_powers) * 0.5
+        trajectory = [
+            {
+                "round": r,
+                "gap": round(g, 3),
+                "position_a": round(ethical_a + d, 3),
+                "position_b": round(ethical_b - d, 3)
+            }
+            for r, g, d in zip(range(1, len(gaps) + 1), gaps.tolist(), shift.tolist())
+        ]
 
         return {
             "expected_rounds": rounds,
@@ -508,13 +729,14 @@ class BachGovernanceAPI:
 
     def diagnose_capability_gap(self, country_iso3, target_gwc=0.8):
         """Hierarchical capability gap diagnosis"""
-        oecd = self.get_oecd_compliance(country_iso3)
-        privacy = self.get_privacy_score(country_iso3)
-        pattern = self.get_argumentation_pattern(country_iso3)
+        row = self._country_row(country_iso3)
+        implementation = float(self.oecd_arr[row, self.OECD_IMPLEMENTATION])
+        privacy_overall = float(self.privacy_arr[row, self.PRIVACY_OVERALL])
+        consensus = float(self.pattern_arr[row, self.PATTERN_CONSENSUS])
 
-        current_gwc = (oecd["implementation_score"] * 0.4 +
-                      privacy["overall"] * 0.3 +
-                      pattern["consensus_tendency"] * 0.3)
+        current_gwc = (implementation * 0.4 +
+                      privacy_overall * 0.3 +
+                      consensus * 0.3)
 
         gap = target_gwc - current_gwc
 
@@ -527,33 +749,21 @@ class BachGovernanceAPI:
                 "priorities": []
             }
 
-        broad_capabilities = {
-            "STI": {"score": 0.70, "weight": 0.15, "gap_contribution": 0},
-            "ESI": {"score": 0.63, "weight": 0.18, "gap_contribution": 0},
-            "IIC": {"score": 0.64, "weight": 0.16, "gap_contribution": 0},
-            "NDM": {"score": 0.68, "weight": 0.15, "gap_contribution": 0},
-            "SRA": {"score": 0.72, "weight": 0.14, "gap_contribution": 0},
-            "SAD": {"score": 0.66, "weight": 0.12, "gap_contribution": 0},
-            "ASI": {"score": 0.69, "weight": 0.10, "gap_contribution": 0}
-        }
-
-        for bgc_name, bgc_data in broad_capabilities.items():
-            bgc_gap = (target_gwc * bgc_data["weight"]) - (bgc_data["score"] * bgc_data["weight"])
-            bgc_data["gap_contribution"] = bgc_gap / gap if gap > 0 else 0
-
-        sorted_capabilities = sorted(broad_capabilities.items(),
-                                    key=lambda x: x[1]["gap_contribution"],
-                                    reverse=True)
+        bgc_gaps = (target_gwc * self.BGC_WEIGHTS) - (self.BGC_SCORES * self.BGC_WEIGHTS)
+        gap_contributions = bgc_gaps / gap
+        # Stable sort keeps table order among ties, as sorted(..., reverse=True) did
+        top = np.argsort(-gap_contributions, kind="stable")[:3]
 
         priorities = []
-        for i, (bgc_name, bgc_data) in enumerate(sorted_capabilities[:3]):
+        for i, idx in enumerate(top.tolist()):
+            bgc_name = str(self.BGC_NAMES[idx])
             if bgc_name in self.narrow_factors:
                 narrow = self.narrow_factors[bgc_name]
                 sorted_narrow = sorted(narrow.items(), key=lambda x: x[1])
                 priorities.append({
                     "capability": bgc_name,
-                    "current_score": round(bgc_data["score"], 3),
-                    "gap_contribution": round(bgc_data["gap_contribution"] * 100, 1),
+                    "current_score": round(float(self.BGC_SCORES[idx]), 3),
+                    "gap_contribution": round(float(gap_contributions[idx]) * 100, 1),
                     "investment_priority": i + 1,
                     "limiting_factors": [{"factor": k, "score": round(v, 3)}
                                        for k, v in sorted_narrow[:2]]
@@ -573,47 +783,41 @@ class BachGovernanceAPI:
 
     def compute_pareto_scenarios(self, country_a, country_b, policy_options):
         """Multi-objective Pareto optimization"""
-        scenarios = []
-
-        for policy in policy_options:
-            ethical_a = self.calculate_ethical_alignment(country_a, policy)
-            ethical_b = self.calculate_ethical_alignment(country_b, policy)
-            privacy_a = self.get_privacy_score(country_a)["overall"]
-            privacy_b = self.get_privacy_score(country_b)["overall"]
-            pattern_a = self.get_argumentation_pattern(country_a)
-            pattern_b = self.get_argumentation_pattern(country_b)
-
-            avg_ethical = (ethical_a + ethical_b) / 2
-            avg_privacy = (privacy_a + privacy_b) / 2
-            speed = (pattern_a["consensus_tendency"] + pattern_b["consensus_tendency"]) / 2
-            innovation = 1 - abs(ethical_a - ethical_b)
-
-            scenarios.append({
+        row_a, row_b = self._country_row(country_a), self._country_row(country_b)
+
+        # Privacy and speed depend only on the two countries, not the policy
+        privacy_a, privacy_b = self.privacy_arr[[row_a, row_b], self.PRIVACY_OVERALL].tolist()
+        consensus_a, consensus_b = self.pattern_arr[[row_a, row_b], self.PATTERN_CONSENSUS].tolist()
+        avg_privacy = (privacy_a + privacy_b) / 2
+        speed = (consensus_a + consensus_b) / 2
+
+        ethical_a = self.calculate_ethical_alignment_batch(country_a, policy_options)
+        ethical_b = self.calculate_ethical_alignment_batch(country_b, policy_options)
+        avg_ethical = (ethical_a + ethical_b) / 2
+        innovation = 1 - np.abs(ethical_a - ethical_b)
+        composite = (avg_ethical + avg_privacy + speed + innovation) / 4
+
+        scenarios = [
+            {
                 "policy": policy,
-                "ethical_alignment": round(avg_ethical, 3),
+                "ethical_alignment": round(ethical, 3),
                 "privacy_protection": round(avg_privacy, 3),
                 "speed_to_agreement": round(speed, 3),
-                "innovation_potential": round(innovation, 3),
-                "composite_score": round((avg_ethical + avg_privacy + speed + innovation) / 4, 3)
-            })
+                "innovation_potential": round(innov, 3),
+                "composite_score": round(score, 3)
+            }
+            for policy, ethical, innov, score in zip(
+                policy_options, avg_ethical.tolist(), innovation.tolist(), composite.tolist()
+            )
+        ]
 
         # Identify Pareto optimal scenarios
-        pareto_optimal = []
-        for s1 in scenarios:
-            dominated = False
-            for s2 in scenarios:
-                if (s2["ethical_alignment"] >= s1["ethical_alignment"] and
-                    s2["privacy_protection"] >= s1["privacy_protection"] and
-                    s2["speed_to_agreement"] >= s1["speed_to_agreement"] and
-                    s2["innovation_potential"] >= s1["innovation_potential"] and
-                    (s2["ethical_alignment"] > s1["ethical_alignment"] or
-                     s2["privacy_protection"] > s1["privacy_protection"] or
-                     s2["speed_to_agreement"] > s1["speed_to_agreement"] or
-                     s2["innovation_potential"] > s1["innovation_potential"])):
-                    dominated = True
-                    break
-            if not dominated:
-                pareto_optimal.append(s1)
+        # float32 is exact for dominance here: objectives are already rounded to 3 decimals,
+        # and float32 keeps distinct 3-decimal values distinct and in order
+        objectives = np.array([[s[k] for k in self.PARETO_OBJECTIVES] for s in scenarios],
+                              dtype=np.float32).reshape(-1, len(self.PARETO_OBJECTIVES))
+        optimal_mask = self._pareto_optimal_mask(objectives)
+        pareto_optimal = [s for s, optimal in zip(scenarios, optimal_mask) if optimal]
 
         return {
             "all_scenarios": scenarios,
@@ -622,86 +826,132 @@ class BachGovernanceAPI:
             "recommendation": max(pareto_optimal, key=lambda x: x["composite_score"]) if pareto_optimal else scenarios[0]
         }
 
+    @staticmethod
+    def _pareto_optimal_mask(objectives, chunk_size=256, skyline_threshold=200):
+        """Boolean mask of the non-dominated rows of an (N, K) objective matrix"""
+        n = len(objectives)
+        if n >= skyline_threshold:
+            return BachGovernanceAPI._skyline_mask(objectives)
+        dominated = np.zeros(n, dtype=bool)
+        # Broadcast candidate dominators in chunks to cap memory at O(chunk * N * K)
+        for start in range(0, n, chunk_size):
+            block = objectives[start:start + chunk_size, None, :]
+            ge = (block >= objectives[None, :, :]).all(axis=2)
+            gt = (block > objectives[None, :, :]).any(axis=2)
+            dominated |= (ge & gt).any(axis=0)
+        return ~dominated
+
+    @staticmethod
+    def _skyline_mask(objectives):
+        """Sort-filter skyline: same mask as the pairwise check, comparing only against the front"""
+        # In descending lexicographic order every dominator precedes the rows it dominates,
+        # so a row is optimal iff no row already accepted into the front dominates it
+        order = np.lexsort(-objectives.T[::-1])
+        mask = np.zeros(len(objectives), dtype=bool)
+        front = np.empty_like(objectives)
+        size = 0
+        for i in order:
+            row = objectives[i]
+            accepted = front[:size]
+            if size and ((accepted >= row).all(axis=1) & (accepted > row).any(axis=1)).any():
+                continue
+            front[size] = row
+            size += 1
+            mask[i] = True
+        return mask
+
     # =================================================================
     # ENHANCEMENT 5: NETWORK DIFFUSION SIMULATION
     # =================================================================
 
     def simulate_policy_diffusion(self, initial_adopters, policy, rounds=10, influence_strength=0.3):
         """Simulate policy diffusion through influence networks"""
-        countries = list(self.oecd_adoption.keys())
-        adoption_state = {c: 1.0 if c in initial_adopters else 0.0 for c in countries}
+        countries = self.diffusion_countries
+        W = self.influence_matrix
 
-        # Build influence matrix
-        W = np.zeros((len(countries), len(countries)))
-        country_idx = {c: i for i, c in enumerate(countries)}
+        # (rounds + 1, N) adoption levels; row t is the state after t rounds
+        x0 = np.array([1.0 if c in initial_adopters else 0.0 for c in countries])
+        return self._diffusion_result(_diffuse(W, x0, rounds, float(influence_strength)), x0)
 
-        for src in countries:
-            if src in self.influence_network:
-                for tgt, weight in self.influence_network[src].items():
-                    if tgt in country_idx:
-                        W[country_idx[src], country_idx[tgt]] = weight
-
-        # Normalize rows
-        row_sums = W.sum(axis=1, keepdims=True)
-        row_sums[row_sums == 0] = 1
-        W = W / row_sums
+    def simulate_policy_diffusion_batch(self, initial_adopter_sets, policy, rounds=10, influence_strength=0.3):
+        """Run simulate_policy_diffusion for many initial-adopter sets, in parallel when numba is installed"""
+        countries = self.diffusion_countries
+        X0 = np.zeros((len(initial_adopter_sets), len(countries)))
+        for row, adopters in enumerate(initial_adopter_sets):
+            X0[row] = [1.0 if c in adopters else 0.0 for c in countries]
 
-        trajectory = [adoption_state.copy()]
+        batch = _diffuse_batch(self.influence_matrix, X0, rounds, float(influence_strength))
+        return [self._diffusion_result(states, x0) for states, x0 in zip(batch, X0)]
 
-        for t in range(rounds):
-            x = np.array([adoption_state[c] for c in countries])
-            x_new = (1 - influence_strength) * x + influence_strength * (W @ x)
-            x_new = np.clip(x_new, 0, 1)
-            adoption_state = {c: x_new[i] for i, c in enumerate(countries)}
-            trajectory.append(adoption_state.copy())
+    def _diffusion_result(self, states, x0):
+        """Summarize one (rounds + 1, N) diffusion run started from x0"""
+        countries = self.diffusion_countries
 
-        # Identify tipping points
-        tipping_rounds = {}
-        for c in countries:
-            for r, state in enumerate(trajectory):
-                if state[c] > 0.5 and c not in initial_adopters:
-                    tipping_rounds[c] = r
-                    break
+        # Tipping point: first round each non-initial adopter passes 0.5
+        crossed = states > 0.5
+        first_round = crossed.argmax(axis=0).tolist()
+        tipped = (crossed.any(axis=0) & (x0 == 0.0)).tolist()
+        tipping_rounds = {c: r for c, r, t in zip(countries, first_round, tipped) if t}
 
         return {
-            "trajectory": trajectory,
+            "trajectory": DiffusionTrajectory(states, countries),
             "tipping_rounds": tipping_rounds,
-            "final_adoption": {c: round(trajectory[-1][c], 3) for c in countries},
-            "cascade_probability": sum(1 for v in trajectory[-1].values() if v > 0.7) / len(countries)
+            "final_adoption": dict(zip(countries, np.round(states[-1], 3).tolist())),
+            "cascade_probability": np.count_nonzero(states[-1] > 0.7) / len(countries)
         }
 
     # =================================================================
     # ENHANCEMENT 6: HISTORICAL PATTERN MATCHING
     # =================================================================
 
-    def match_historical_scenarios(self, current_actors, power_asymmetry, issue_salience, time_pressure):
-        """Match current scenario to historical precedents"""
-        current_features = np.array([
+    def match_historical_scenarios(self, current_actors, power_asymmetry, issue_salience, time_pressure, top_k=None):
+        """Match current scenario to historical precedents, optionally keeping only the top_k most relevant"""
+        current_features = self._unit_rows(np.array([
             power_asymmetry,
             issue_salience,
             time_pressure,
             (power_asymmetry + issue_salience) / 2
-        ])
+        ]))
 
-        matches = []
-        for scenario_name, scenario_data in self.historical_scenarios.items():
-            similarity = cosine_similarity([current_features], [scenario_data["features"]])[0][0]
-            actor_overlap = len(set(current_actors) & set(scenario_data["actors"])) / len(set(current_actors) | set(scenario_data["actors"]))
-            relevance = similarity * 0.7 + actor_overlap * 0.3
+        similarities = (self.historical_features_unit @ current_features).tolist()
+
+        # Actors outside the vocabulary never intersect, but still count towards each union
+        current_actors = set(current_actors)
+        known = [self.historical_actor_idx[a] for a in current_actors if a in self.historical_actor_idx]
+        shared = self.historical_actor_mask[:, known].sum(axis=1)
+        overlaps = (shared / (len(current_actors) + self.historical_actor_counts - shared)).tolist()
+
+        relevances = [round(s * 0.7 + o * 0.3, 3) for s, o in zip(similarities, overlaps)]
 
+        candidates = range(len(relevances))
+        if top_k is not None and top_k < len(relevances):
+            # Only rows at or above the k-th best relevance can make the cut; ties keep scenario order
+            rel = np.array(relevances)
+            cutoff = rel[np.argpartition(-rel, top_k - 1)[top_k - 1]]
+            candidates = np.flatnonzero(rel >= cutoff).tolist()
+        ranked = sorted(candidates, key=lambda i: relevances[i], reverse=True)[:top_k]
+
+        matches = []
+        for i in ranked:
+            scenario_name = self.historical_names[i]
+            scenario_data = self.historical_scenarios[scenario_name]
             matches.append({
                 "scenario": scenario_name,
-                "similarity": round(similarity, 3),
-                "relevance": round(relevance, 3),
+                "similarity": round(similarities[i], 3),
+                "relevance": relevances[i],
                 "outcome": scenario_data["outcome"],
                 "success_rate": scenario_data["success_rate"],
                 "key_lesson": scenario_data["key_lesson"],
                 "actors": scenario_data["actors"]
             })
-
-        matches.sort(key=lambda x: x["relevance"], reverse=True)
         return matches
 
+    @staticmethod
+    def _unit_rows(v):
+        """Scale v (or each row of v) to unit length; zero rows stay zero"""
+        norm = np.linalg.norm(v, axis=-1, keepdims=True)
+        return np.divide(v, norm, out=np.zeros_like(v, dtype=float), where=norm > 0)
+
     # =================================================================
     # ENHANCEMENT 7: MATURITY TRAJECTORY PLANNING
     # =================================================================
@@ -710,32 +960,20 @@ class BachGovernanceAPI:
         """Calculate capability maturity growth trajectory"""
         current_gwc = self.diagnose_capability_gap(country_iso3, 0.8)["current_gwc"]
 
-        def gwc_to_maturity(gwc):
-            if gwc < 0.4: return 1
-            elif gwc < 0.6: return 2
-            elif gwc < 0.75: return 3
-            else: return 4
-
-        current_maturity = gwc_to_maturity(current_gwc)
+        current_maturity = int(np.searchsorted(self.MATURITY_GWC_THRESHOLDS, current_gwc, side="right")) + 1
         M_max = 4
         rho = 0.05  # Natural growth rate
+        intervention_effect = investment_per_month * 0.01
 
-        trajectory = []
-        M = current_maturity
-
-        for month in range(months):
-            intervention_effect = investment_per_month * 0.01
-            dM = rho * M * (1 - M / M_max) + intervention_effect
-            M = min(M + dM, M_max)
-
-            trajectory.append({
+        path = _maturity_path(float(current_maturity), months, intervention_effect, rho, float(M_max), float(target_level))
+        trajectory = [
+            {
                 "month": month + 1,
                 "maturity": round(M, 2),
                 "gwc_equivalent": round(M / M_max, 3)
-            })
-
-            if M >= target_level:
-                break
+            }
+            for month, M in enumerate(path.tolist())
+        ]
 
         months_to_target = next((t["month"] for t in trajectory if t["maturity"] >= target_level), months)
         total_investment = months_to_target * investment_per_month
@@ -756,12 +994,14 @@ class BachGovernanceAPI:
     def initialize_kalman_filter(self, country_iso3):
         """Initialize Kalman filter for capability tracking"""
         current_gwc = self.diagnose_capability_gap(country_iso3, 0.8)["current_gwc"]
+        history = KalmanHistory()
+        history.append(current_gwc, 0.1)
         self.kalman_states[country_iso3] = {
             "x_hat": current_gwc,
             "P": 0.1,
             "Q": 0.01,
             "R": 0.05,
-            "history": [(0, current_gwc, 0.1)]
+            "history": history
         }
 
     def kalman_update(self, country_iso3, new_measurement, intervention_effect=0.0):
@@ -785,7 +1025,7 @@ class BachGovernanceAPI:
 
         state["x_hat"] = x_hat_new
         state["P"] = P_new
-        state["history"].append((len(state["history"]), x_hat_new, P_new))
+        state["history"].append(x_hat_new, P_new)
 
         return {
             "smoothed_estimate": round(x_hat_new, 3),
@@ -793,6 +1033,75 @@ class BachGovernanceAPI:
             "confidence": round((1 - P_new) * 100, 1)
         }
 
+    def kalman_update_batch(self, country_iso3_list, new_measurements, intervention_effects=0.0):
+        """Apply kalman_update to several distinct countries in one vectorized pass"""
+        if len(set(country_iso3_list)) != len(country_iso3_list):
+            # Every update starts from the pre-batch prior, so repeats cannot be filtered in sequence
+            raise ValueError("kalman_update_batch needs distinct countries; use kalman_update for repeats")
+        for iso in country_iso3_list:
+            if iso not in self.kalman_states:
+                self.initialize_kalman_filter(iso)
+
+        states = [self.kalman_states[iso] for iso in country_iso3_list]
+        x_hat = np.array([state["x_hat"] for state in states])
+        P = np.array([state["P"] for state in states])
+        Q = np.array([state["Q"] for state in states])
+        R = np.array([state["R"] for state in states])
+
+        # Same scalar model as kalman_update (A = C = 1, B = 0.1), elementwise over countries
+        x_pred = x_hat + 0.1 * np.asarray(intervention_effects, dtype=float)
+        P_pred = P + Q
+        K = P_pred / (P_pred + R)
+        x_hat_new = (x_pred + K * (np.asarray(new_measurements, dtype=float) - x_pred)).tolist()
+        P_new = ((1 - K) * P_pred).tolist()
+
+        results = {}
+        for iso, state, x, p in zip(country_iso3_list, states, x_hat_new, P_new):
+            state["x_hat"] = x
+            state["P"] = p
+            state["history"].append(x, p)
+            results[iso] = {
+                "smoothed_estimate": round(x, 3),
+                "uncertainty": round(p, 3),
+                "confidence": round((1 - p) * 100, 1)
+            }
+        return results
+
+    def kalman_filter_series(self, country_iso3, measurements, intervention_effects=0.0):
+        """Forward-filter a whole measurement series from the country's current state, without updating it
+
+        Each step matches calling kalman_update in sequence; there is no backward (RTS) smoothing pass,
+        so estimates only use measurements up to that step.
+        """
+        if country_iso3 not in self.kalman_states:
+            self.initialize_kalman_filter(country_iso3)
+
+        state = self.kalman_states[country_iso3]
+        z = np.asarray(measurements, dtype=float)
+        u = np.broadcast_to(np.asarray(intervention_effects, dtype=float), z.shape)
+        Q, R = state["Q"], state["R"]
+
+        # The variance recursion P -> R(P + Q) / (P + Q + R) is a Mobius map that ignores the data
+        step = np.array([[R, R * Q], [1.0, Q + R]])
+        maps = _mobius_prefix(np.broadcast_to(step, (len(z), 2, 2)))
+        P = (maps[:, 0, 0] * state["P"] + maps[:, 0, 1]) / (maps[:, 1, 0] * state["P"] + maps[:, 1, 1])
+
+        # With the gains known, each estimate is an affine map of the previous one
+        P_pred = np.concatenate(([state["P"]], P[:-1])) + Q
+        K = P_pred / (P_pred + R)
+        a, b = _affine_prefix(1 - K, (1 - K) * 0.1 * u + K * z)
+        x_hat = a * state["x_hat"] + b
+
+        return [
+            {
+                "step": t + 1,
+                "smoothed_estimate": round(x, 3),
+                "uncertainty": round(p, 3),
+                "confidence": round((1 - p) * 100, 1)
+            }
+            for t, (x, p) in enumerate(zip(x_hat.tolist(), P.tolist()))
+        ]
+
     # =================================================================
     # ENHANCEMENT 9: RL-OPTIMIZED NEGOTIATION STRATEGIES
     # =================================================================
@@ -800,44 +1109,36 @@ class BachGovernanceAPI:
     def optimize_negotiation_strategy(self, country_a, country_b, policy, num_simulations=100):
         """RL-based negotiation strategy optimization"""
         actions = ["propose_ambitious", "make_concession", "threaten", "delay", "build_coalition"]
-        Q = {action: 0.0 for action in actions}
-        visits = {action: 0 for action in actions}
-
-        def simulate_action_outcome(action, ethical_gap, trust_level):
-            if action == "propose_ambitious":
-                reward = 0.8 * trust_level if ethical_gap < 0.3 else -0.2
-            elif action == "make_concession":
-                reward = 0.6 + (1 - ethical_gap) * 0.3
-            elif action == "threaten":
-                reward = -0.3 if trust_level > 0.5 else 0.2
-            elif action == "delay":
-                reward = -0.1 if ethical_gap < 0.2 else 0.3
-            else:  # build_coalition
-                reward = 0.7 if ethical_gap > 0.4 else 0.4
-
-            return reward + np.random.normal(0, 0.1)
 
         ethical_gap = abs(
             self.calculate_ethical_alignment(country_a, policy) -
             self.calculate_ethical_alignment(country_b, policy)
         )
-        trust_level = (
-            self.get_argumentation_pattern(country_a)["consensus_tendency"] +
-            self.get_argumentation_pattern(country_b)["consensus_tendency"]
+        trust_level = float(
+            self.pattern_arr[self._country_row(country_a), self.PATTERN_CONSENSUS] +
+            self.pattern_arr[self._country_row(country_b), self.PATTERN_CONSENSUS]
         ) / 2
 
-        for _ in range(num_simulations):
-            for action in actions:
-                reward = simulate_action_outcome(action, ethical_gap, trust_level)
-                visits[action] += 1
-                Q[action] = Q[action] + (reward - Q[action]) / visits[action]
+        # Deterministic reward of each action, in the order of `actions`
+        base_rewards = np.array([
+            0.8 * trust_level if ethical_gap < 0.3 else -0.2,
+            0.6 + (1 - ethical_gap) * 0.3,
+            -0.3 if trust_level > 0.5 else 0.2,
+            -0.1 if ethical_gap < 0.2 else 0.3,
+            0.7 if ethical_gap > 0.4 else 0.4
+        ])
+
+        # Every action is tried once per simulation, so each Q-value is the mean of its noisy rewards
+        rewards = base_rewards + np.random.normal(0, 0.1, size=(num_simulations, len(actions)))
+        q = rewards.sum(axis=0) / max(num_simulations, 1)
+        Q = dict(zip(actions, q))
 
         sorted_actions = sorted(Q.items(), key=lambda x: x[1], reverse=True)
         expected_outcome = max(Q.values()) * 0.7 + 0.3
 
         return {
             "optimal_action_sequence": [a[0] for a in sorted_actions[:3]],
-            "q_values": {k: round(v, 3) for k, v in Q.items()},
+            "q_values": dict(zip(actions, np.round(q, 3).tolist())),
             "expected_agreement_probability": round(min(expected_outcome, 0.95), 3),
             "recommended_first_move": sorted_actions[0][0],
             "explanation": self._explain_strategy(sorted_actions[0][0])
@@ -860,52 +1161,54 @@ class BachGovernanceAPI:
 
     def calculate_ethical_alignment(self, country_iso3, policy_scenario):
         """Calculate ethical alignment score"""
-        oecd = self.get_oecd_compliance(country_iso3)
-        privacy = self.get_privacy_score(country_iso3)
-
-        scenario_weights = {
-            "AI Ethics": {"oecd": 0.6, "privacy": 0.4},
-            "AI Safety": {"oecd": 0.7, "privacy": 0.3},
-            "Data Privacy": {"oecd": 0.3, "privacy": 0.7},
-            "Export Controls": {"oecd": 0.5, "privacy": 0.5},
-            "R&D Investment": {"oecd": 0.8, "privacy": 0.2}
-        }
+        adoption, implementation = self.oecd_arr[self._country_row(country_iso3)].tolist()
+        privacy_score = float(self.privacy_arr[self._country_row(country_iso3), self.PRIVACY_OVERALL])
 
-        weights = scenario_weights.get(policy_scenario, {"oecd": 0.5, "privacy": 0.5})
-        oecd_score = (oecd["adoption_level"] + oecd["implementation_score"]) / 2
-        privacy_score = privacy["overall"]
+        oecd_weight, privacy_weight = self.SCENARIO_WEIGHTS.get(policy_scenario, self.DEFAULT_SCENARIO_WEIGHTS)
+        oecd_score = (adoption + implementation) / 2
 
-        ethical_alignment = (oecd_score * weights["oecd"]) + (privacy_score * weights["privacy"])
+        ethical_alignment = (oecd_score * oecd_weight) + (privacy_score * privacy_weight)
         return round(ethical_alignment, 3)
 
+    def calculate_ethical_alignment_batch(self, country_iso3, policy_scenarios):
+        """Calculate ethical alignment scores for several policy scenarios at once"""
+        adoption, implementation = self.oecd_arr[self._country_row(country_iso3)].tolist()
+        privacy_score = float(self.privacy_arr[self._country_row(country_iso3), self.PRIVACY_OVERALL])
+
+        weights = np.array([self.SCENARIO_WEIGHTS.get(p, self.DEFAULT_SCENARIO_WEIGHTS) for p in policy_scenarios],
+                           dtype=float).reshape(-1, 2)
+        oecd_score = (adoption + implementation) / 2
+
+        ethical_alignment = (oecd_score * weights[:, 0]) + (privacy_score * weights[:, 1])
+        # Built-in round() so ties resolve exactly as in calculate_ethical_alignment
+        return np.array([round(x, 3) for x in ethical_alignment.tolist()])
+
     def get_oecd_principles(self):
         return self.oecd_principles
 
     def get_oecd_compliance(self, country_iso3):
-        return self.oecd_adoption.get(country_iso3, {
-            "adoption_level": 0.50,
-            "implementation_score": 0.45,
-            "signatory": False
-        })
+        return self.oecd_adoption.get(country_iso3, self.DEFAULT_OECD_COMPLIANCE)
 
     def get_privacy_score(self, country_iso3):
-        return self.privacy_scores.get(country_iso3, {
-            "legal_framework": 0.50,
-            "enforcement": 0.50,
-            "surveillance_concerns": 0.50,
-            "data_protection": 0.50,
-            "overall": 0.50
-        })
+        return self.privacy_scores.get(country_iso3, self.DEFAULT_PRIVACY_SCORE)
 
     def get_argumentation_pattern(self, country_iso3):
-        return self.argumentation_patterns.get(country_iso3, {
-            "primary_frame": "Balanced Approach",
-            "secondary_frame": "Public Interest",
-            "rhetoric_style": "neutral",
-            "consensus_tendency": 0.65,
-            "debate_intensity": 0.60
-        })
-
-@st.cache_resource
-def get_bach_api_client():
+        return self.argumentation_patterns.get(country_iso3, self.DEFAULT_ARGUMENTATION_PATTERN)
+
+def _create_bach_api_client():
     return BachGovernanceAPI()
+
+
+_cached_client_factory = None
+
+
+def get_bach_api_client():
+    global _cached_client_factory
+    if _cached_client_factory is None:
+        # Deferred so headless users of this module never pay for importing streamlit
+        import streamlit as st
+        # One client per server process: reruns reuse its Phase 2 cache and pooled session
+        _cached_client_factory = st.cache_resource(
+            show_spinner="Loading Phase 2 governance data..."
+        )(_create_bach_api_client)
+    return _cached_client_factory()
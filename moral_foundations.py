@@ -12,11 +12,71 @@ Based on:
 - Evans AGPO Framework mathematical formalization
 """
 
+import math
+import sys
 import numpy as np
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, field
-from enum import Enum
-import json
+from dataclasses import dataclass, field, InitVar
+from enum import Enum, IntEnum
+from operator import attrgetter, itemgetter
+from scipy.spatial.distance import pdist, squareform
+
+try:
+    from numba import njit
+except ImportError:  # numba is in requirements.txt; without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# ============================================================================
+# SCALAR FOUNDATION KERNELS - JIT-compiled when numba is installed
+# ============================================================================
+
+@njit(cache=True)
+def _clip_pm1(x):
+    """Clamp a scalar to [-1, 1] without going through the np.clip ufunc"""
+    return -1.0 if x < -1.0 else (1.0 if x > 1.0 else x)
+
+
+@njit(cache=True)
+def _care_harm_score(w_safety, w_privacy, w_vulnerable, w_harm,
+                     safety, privacy, vulnerable, harm_prevention,
+                     implementation_cost, enforcement_difficulty):
+    """Care/Harm score in [-1, 1]; see MoralEvaluator.evaluate_care_harm"""
+    care_score = w_safety * safety + w_privacy * privacy + w_vulnerable * vulnerable + w_harm * harm_prevention
+    regulatory_harm = 0.3 * implementation_cost + 0.2 * enforcement_difficulty
+    net_score = care_score - 0.3 * regulatory_harm
+    return _clip_pm1(2 * net_score - 1)
+
+
+@njit(cache=True)
+def _fairness_cheating_score(w_equity, w_procedural, w_access, w_burden,
+                             equity, procedural, access, small_actor_burden):
+    """Fairness/Cheating score in [-1, 1]; see MoralEvaluator.evaluate_fairness_cheating"""
+    fairness_score = w_equity * equity + w_procedural * procedural + w_access * access
+    net_score = fairness_score - w_burden * small_actor_burden
+    return _clip_pm1(2 * net_score - 1)
+
+
+@njit(cache=True)
+def _loyalty_betrayal_score(w_national, w_competitiveness, w_cooperation, w_solidarity,
+                            national, competitiveness_impact, cooperation, solidarity):
+    """Loyalty/Betrayal score in [-1, 1]; competitiveness_impact is a harm, so it is inverted"""
+    loyalty_score = (w_national * national + w_competitiveness * (1 - competitiveness_impact) +
+                     w_cooperation * cooperation + w_solidarity * solidarity)
+    return _clip_pm1(2 * loyalty_score - 1)
+
+
+@njit(cache=True)
+def _weighted_foundation_score(w0, w1, w2, w3, x0, x1, x2, x3):
+    """Four-term weighted foundation score in [-1, 1] (Authority, Sanctity)"""
+    score = w0 * x0 + w1 * x1 + w2 * x2 + w3 * x3
+    return _clip_pm1(2 * score - 1)
 
 
 class FoundationType(Enum):
@@ -28,7 +88,23 @@ class FoundationType(Enum):
     SANCTITY_DEGRADATION = "sanctity_degradation"
 
 
-@dataclass
+# Foundation names in FoundationType order; the column order of every (.., 5) array
+FOUNDATION_ORDER = tuple(foundation.value for foundation in FoundationType)
+
+# Display label per foundation name, e.g. "Care/Harm"
+FOUNDATION_LABELS = {name: name.replace('_', '/').title() for name in FOUNDATION_ORDER}
+
+# Unordered foundation pairs (i, j) with the alphabetically smaller name first, in
+# the order MoralExplainer reports conflicts
+_CONFLICT_FIRST, _CONFLICT_SECOND = np.array([
+    (i, j)
+    for i, first in enumerate(FOUNDATION_ORDER)
+    for j, second in enumerate(FOUNDATION_ORDER)
+    if first < second
+]).T
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PolicyFeatures:
     """
     Structured representation of AI governance policy characteristics
@@ -75,7 +151,74 @@ class PolicyFeatures:
     enforcement_difficulty: float = 0.5 # [0,1] practical implementability
 
 
-@dataclass
+class FeatureIdx(IntEnum):
+    """Column of each PolicyFeatures score in a PolicyBatch feature matrix"""
+    SAFETY_REQUIREMENTS = 0
+    HARM_PREVENTION = 1
+    VULNERABLE_PROTECTION = 2
+    PRIVACY_SAFEGUARDS = 3
+    EQUITY_PROVISIONS = 4
+    PROCEDURAL_FAIRNESS = 5
+    ACCESS_EQUALITY = 6
+    SMALL_ACTOR_BURDEN = 7
+    NATIONAL_ADVANTAGE = 8
+    COMPETITIVENESS_IMPACT = 9
+    CROSS_BORDER_COOPERATION = 10
+    INGROUP_SOLIDARITY = 11
+    INSTITUTIONAL_CLARITY = 12
+    REGULATORY_STRENGTH = 13
+    PRECEDENT_ALIGNMENT = 14
+    EXPERT_DEFERENCE = 15
+    HUMAN_DIGNITY = 16
+    PRIVACY_SANCTITY = 17
+    TRANSPARENCY_NORMS = 18
+    MANIPULATION_PREVENTION = 19
+    IMPLEMENTATION_COST = 20
+    INNOVATION_IMPACT = 21
+    ENFORCEMENT_DIFFICULTY = 22
+
+
+# Scenario weight keys in the argument order of each foundation kernel
+_HARM_WEIGHT_KEYS = itemgetter('safety', 'privacy', 'vulnerable_protection', 'harm_prevention')
+_FAIRNESS_WEIGHT_KEYS = itemgetter('equity', 'procedural', 'access', 'burden_distribution')
+_LOYALTY_WEIGHT_KEYS = itemgetter('national_interest', 'competitiveness', 'cooperation', 'solidarity')
+_AUTHORITY_WEIGHT_KEYS = itemgetter('institutional_clarity', 'enforcement', 'precedent', 'expertise')
+_SANCTITY_WEIGHT_KEYS = itemgetter('human_dignity', 'privacy_sanctity', 'transparency_norms',
+                                   'manipulation_prevention')
+
+# Batch scores this close to a constraint threshold are re-checked with the exact
+# per-policy kernels; the matmul is within ~1e-15 of them for [0, 1] features
+BATCH_RESCORE_MARGIN = 1e-9
+
+# Per-evaluator bound on memoized evaluate_all_foundations results
+SCORE_CACHE_SIZE = 128
+
+_policy_feature_values = attrgetter(*(idx.name.lower() for idx in FeatureIdx))
+
+
+class PolicyBatch:
+    """
+    Struct-of-arrays layout for many policies
+    One (N, 23) float matrix, columns indexed by FeatureIdx
+    """
+
+    def __init__(self, features: np.ndarray, policy_ids: Optional[List[str]] = None):
+        self.features = np.asarray(features, dtype=np.float64).reshape(-1, len(FeatureIdx))
+        self.policy_ids = list(policy_ids) if policy_ids is not None else None
+
+    @classmethod
+    def from_features(cls, policies: List[PolicyFeatures]) -> 'PolicyBatch':
+        """Stack PolicyFeatures scores into one feature matrix"""
+        return cls(
+            np.array([_policy_feature_values(policy) for policy in policies], dtype=np.float64),
+            [policy.policy_id for policy in policies]
+        )
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MoralFoundations:
     """
     Agent's moral foundation weights
@@ -86,13 +229,18 @@ class MoralFoundations:
     loyalty_betrayal: float = 0.2     # Weight on group solidarity
     authority_subversion: float = 0.2 # Weight on institutional order
     sanctity_degradation: float = 0.2 # Weight on human dignity/purity
+    normalize: InitVar[bool] = True   # False when the weights are already normalized
 
-    def __post_init__(self):
+    def __post_init__(self, normalize: bool):
         """Normalize weights to sum to 1.0"""
+        if not normalize:
+            return
         total = (self.care_harm + self.fairness_cheating +
                 self.loyalty_betrayal + self.authority_subversion +
                 self.sanctity_degradation)
-        if total > 0:
+        # True division, not multiplication by 1/total: the reciprocal is off by an
+        # ulp for most totals, enough to flip rounded contributions in explanations
+        if total > 0 and total != 1.0:
             self.care_harm /= total
             self.fairness_cheating /= total
             self.loyalty_betrayal /= total
@@ -109,12 +257,53 @@ class MoralFoundations:
             'sanctity_degradation': self.sanctity_degradation
         }
 
+    def to_vector(self) -> np.ndarray:
+        """Foundation weights as an array, in FoundationType order"""
+        return np.array([
+            self.care_harm,
+            self.fairness_cheating,
+            self.loyalty_betrayal,
+            self.authority_subversion,
+            self.sanctity_degradation
+        ])
+
+    @staticmethod
+    def normalize_matrix(weights: np.ndarray) -> np.ndarray:
+        """
+        Normalize each row of an (S, 5) weight matrix to sum to 1.0
+
+        Same arithmetic as __post_init__ (left-to-right row total, true division,
+        rows with a non-positive total left as-is), for all S agents at once.
+
+        Args:
+            weights: (S, 5) raw weights, columns in FOUNDATION_ORDER
+
+        Returns:
+            New (S, 5) float64 matrix of normalized weights
+        """
+        weights = np.array(weights, dtype=np.float64).reshape(-1, 5)
+        totals = (weights[:, 0] + weights[:, 1] + weights[:, 2] +
+                  weights[:, 3] + weights[:, 4])
+        rescale = (totals > 0) & (totals != 1.0)
+        weights[rescale] /= totals[rescale, None]
+        return weights
+
+    @classmethod
+    def from_matrix(cls, weights: np.ndarray) -> List['MoralFoundations']:
+        """One MoralFoundations per row of an (S, 5) raw weight matrix"""
+        return [cls(*row, normalize=False) for row in cls.normalize_matrix(weights).tolist()]
+
+    @staticmethod
+    def stack(profiles: List['MoralFoundations']) -> np.ndarray:
+        """(S, 5) matrix of foundation weights, one to_vector() row per profile"""
+        return np.array([profile.to_vector() for profile in profiles]).reshape(-1, 5)
+
     def distance_to(self, other: 'MoralFoundations') -> float:
         """
         Compute moral distance between two foundation profiles
         Used for modeling value similarity between agents
         """
-        return np.sqrt(
+        return math.sqrt(
             (self.care_harm - other.care_harm) ** 2 +
             (self.fairness_cheating - other.fairness_cheating) ** 2 +
             (self.loyalty_betrayal - other.loyalty_betrayal) ** 2 +
@@ -123,6 +312,15 @@ class MoralFoundations:
         )
 
 
+def _foundation_weights(agent_foundations) -> Tuple[float, ...]:
+    """Five foundation weights in FOUNDATION_ORDER from MoralFoundations or a (5,) array"""
+    if isinstance(agent_foundations, MoralFoundations):
+        return (agent_foundations.care_harm, agent_foundations.fairness_cheating,
+                agent_foundations.loyalty_betrayal, agent_foundations.authority_subversion,
+                agent_foundations.sanctity_degradation)
+    return tuple(np.asarray(agent_foundations, dtype=float).reshape(5))
+
+
 class MoralEvaluator:
     """
     Core moral evaluation engine
@@ -142,6 +340,16 @@ class MoralEvaluator:
         self.loyalty_weights = self._initialize_loyalty_weights()
         self.authority_weights = self._initialize_authority_weights()
         self.sanctity_weights = self._initialize_sanctity_weights()
+        self.coefficients, self.intercepts = self._build_coefficient_matrix()
+        # Weights resolved once into kernel argument order, so evaluate_* do no string lookups
+        self._harm_args = _HARM_WEIGHT_KEYS(self.harm_weights)
+        self._fairness_args = _FAIRNESS_WEIGHT_KEYS(self.fairness_weights)
+        self._loyalty_args = _LOYALTY_WEIGHT_KEYS(self.loyalty_weights)
+        self._authority_args = _AUTHORITY_WEIGHT_KEYS(self.authority_weights)
+        self._sanctity_args = _SANCTITY_WEIGHT_KEYS(self.sanctity_weights)
+        # Foundation scores keyed by feature values, not policy_id: policies are
+        # mutable and ids are reused (e.g. the dashboard's "DEMO" policy)
+        self._score_cache: Dict[Tuple[float, ...], Dict[str, float]] = {}
 
     def _initialize_harm_weights(self) -> Dict[str, float]:
         """Scenario-specific weights for harm evaluation"""
@@ -213,6 +421,51 @@ class MoralEvaluator:
 
         return base_weights
 
+    def _build_coefficient_matrix(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fold the five foundation formulas into one linear map
+
+        Returns:
+            (C, b) with C of shape (5, 23) over FeatureIdx columns and b of shape (5,),
+            such that raw foundation scores are features @ C.T + b
+        """
+        C = np.zeros((5, len(FeatureIdx)))
+        b = np.zeros(5)
+
+        care, fairness, loyalty, authority, sanctity = C
+        care[FeatureIdx.SAFETY_REQUIREMENTS] = self.harm_weights['safety']
+        care[FeatureIdx.PRIVACY_SAFEGUARDS] = self.harm_weights['privacy']
+        care[FeatureIdx.VULNERABLE_PROTECTION] = self.harm_weights['vulnerable_protection']
+        care[FeatureIdx.HARM_PREVENTION] = self.harm_weights['harm_prevention']
+        care[FeatureIdx.IMPLEMENTATION_COST] = -0.3 * 0.3  # Regulatory harm: economic
+        care[FeatureIdx.ENFORCEMENT_DIFFICULTY] = -0.3 * 0.2  # Regulatory harm: compliance
+
+        fairness[FeatureIdx.EQUITY_PROVISIONS] = self.fairness_weights['equity']
+        fairness[FeatureIdx.PROCEDURAL_FAIRNESS] = self.fairness_weights['procedural']
+        fairness[FeatureIdx.ACCESS_EQUALITY] = self.fairness_weights['access']
+        fairness[FeatureIdx.SMALL_ACTOR_BURDEN] = -self.fairness_weights['burden_distribution']
+
+        loyalty[FeatureIdx.NATIONAL_ADVANTAGE] = self.loyalty_weights['national_interest']
+        loyalty[FeatureIdx.COMPETITIVENESS_IMPACT] = -self.loyalty_weights['competitiveness']
+        loyalty[FeatureIdx.CROSS_BORDER_COOPERATION] = self.loyalty_weights['cooperation']
+        loyalty[FeatureIdx.INGROUP_SOLIDARITY] = self.loyalty_weights['solidarity']
+        b[2] = self.loyalty_weights['competitiveness']  # w * (1 - competitiveness_impact)
+
+        authority[FeatureIdx.INSTITUTIONAL_CLARITY] = self.authority_weights['institutional_clarity']
+        authority[FeatureIdx.REGULATORY_STRENGTH] = self.authority_weights['enforcement']
+        authority[FeatureIdx.PRECEDENT_ALIGNMENT] = self.authority_weights['precedent']
+        authority[FeatureIdx.EXPERT_DEFERENCE] = self.authority_weights['expertise']
+
+        sanctity[FeatureIdx.HUMAN_DIGNITY] = self.sanctity_weights['human_dignity']
+        sanctity[FeatureIdx.PRIVACY_SANCTITY] = self.sanctity_weights['privacy_sanctity']
+        sanctity[FeatureIdx.TRANSPARENCY_NORMS] = self.sanctity_weights['transparency_norms']
+        sanctity[FeatureIdx.MANIPULATION_PREVENTION] = self.sanctity_weights['manipulation_prevention']
+
+        # Fixed for the evaluator's lifetime; evaluate_batch only ever reads them
+        C.setflags(write=False)
+        b.setflags(write=False)
+        return C, b
+
     def evaluate_care_harm(self, policy: PolicyFeatures) -> float:
         """
         Evaluate policy on Care/Harm foundation
@@ -220,24 +473,13 @@ class MoralEvaluator:
         Higher scores = more protective of wellbeing, less harmful
         Range: [-1, 1]
         """
-        # Positive contributions (care)
-        care_score = (
-            self.harm_weights['safety'] * policy.safety_requirements +
-            self.harm_weights['privacy'] * policy.privacy_safeguards +
-            self.harm_weights['vulnerable_protection'] * policy.vulnerable_protection +
-            self.harm_weights['harm_prevention'] * policy.harm_prevention
+        return _care_harm_score(
+            *self._harm_args,
+            policy.safety_requirements, policy.privacy_safeguards,
+            policy.vulnerable_protection, policy.harm_prevention,
+            policy.implementation_cost, policy.enforcement_difficulty
         )
 
-        # Negative contributions (potential harms from regulation itself)
-        regulatory_harm = (
-            0.3 * policy.implementation_cost +  # Economic harm
-            0.2 * policy.enforcement_difficulty  # Compliance burden
-        )
-
-        net_score = care_score - 0.3 * regulatory_harm
-
-        return np.clip(2 * net_score - 1, -1, 1)  # Normalize to [-1, 1]
-
     def evaluate_fairness_cheating(self, policy: PolicyFeatures) -> float:
         """
         Evaluate policy on Fairness/Cheating foundation
@@ -245,23 +487,12 @@ class MoralEvaluator:
         Higher scores = more fair, equitable, just
         Range: [-1, 1]
         """
-        # Positive contributions (fairness)
-        fairness_score = (
-            self.fairness_weights['equity'] * policy.equity_provisions +
-            self.fairness_weights['procedural'] * policy.procedural_fairness +
-            self.fairness_weights['access'] * policy.access_equality
-        )
-
-        # Negative contributions (unfairness)
-        unfairness_penalty = (
-            self.fairness_weights['burden_distribution'] *
-            policy.small_actor_burden  # Disproportionate burden is unfair
+        return _fairness_cheating_score(
+            *self._fairness_args,
+            policy.equity_provisions, policy.procedural_fairness,
+            policy.access_equality, policy.small_actor_burden
         )
 
-        net_score = fairness_score - unfairness_penalty
-
-        return np.clip(2 * net_score - 1, -1, 1)
-
     def evaluate_loyalty_betrayal(self, policy: PolicyFeatures) -> float:
         """
         Evaluate policy on Loyalty/Betrayal foundation
@@ -269,17 +500,12 @@ class MoralEvaluator:
         Higher scores = strengthens ingroup, protects national interests
         Range: [-1, 1]
         """
-        loyalty_score = (
-            self.loyalty_weights['national_interest'] * policy.national_advantage +
-            self.loyalty_weights['competitiveness'] * (1 - policy.competitiveness_impact) +
-            self.loyalty_weights['cooperation'] * policy.cross_border_cooperation +
-            self.loyalty_weights['solidarity'] * policy.ingroup_solidarity
+        return _loyalty_betrayal_score(
+            *self._loyalty_args,
+            policy.national_advantage, policy.competitiveness_impact,
+            policy.cross_border_cooperation, policy.ingroup_solidarity
         )
 
-        # Note: competitiveness_impact represents harm to competitiveness, so we invert it
-
-        return np.clip(2 * loyalty_score - 1, -1, 1)
-
     def evaluate_authority_subversion(self, policy: PolicyFeatures) -> float:
         """
         Evaluate policy on Authority/Subversion foundation
@@ -287,15 +513,12 @@ class MoralEvaluator:
         Higher scores = strengthens legitimate authority, clear governance
         Range: [-1, 1]
         """
-        authority_score = (
-            self.authority_weights['institutional_clarity'] * policy.institutional_clarity +
-            self.authority_weights['enforcement'] * policy.regulatory_strength +
-            self.authority_weights['precedent'] * policy.precedent_alignment +
-            self.authority_weights['expertise'] * policy.expert_deference
+        return _weighted_foundation_score(
+            *self._authority_args,
+            policy.institutional_clarity, policy.regulatory_strength,
+            policy.precedent_alignment, policy.expert_deference
         )
 
-        return np.clip(2 * authority_score - 1, -1, 1)
-
     def evaluate_sanctity_degradation(self, policy: PolicyFeatures) -> float:
         """
         Evaluate policy on Sanctity/Degradation foundation
@@ -303,33 +526,87 @@ class MoralEvaluator:
         Higher scores = protects human dignity, prevents degradation
         Range: [-1, 1]
         """
-        sanctity_score = (
-            self.sanctity_weights['human_dignity'] * policy.human_dignity +
-            self.sanctity_weights['privacy_sanctity'] * policy.privacy_sanctity +
-            self.sanctity_weights['transparency_norms'] * policy.transparency_norms +
-            self.sanctity_weights['manipulation_prevention'] * policy.manipulation_prevention
+        return _weighted_foundation_score(
+            *self._sanctity_args,
+            policy.human_dignity, policy.privacy_sanctity,
+            policy.transparency_norms, policy.manipulation_prevention
         )
 
-        return np.clip(2 * sanctity_score - 1, -1, 1)
+    def evaluate_batch(self, batch: PolicyBatch) -> np.ndarray:
+        """
+        Evaluate many policies across all five foundations at once
+
+        A single (N, 23) @ (23, 5) product against the coefficient matrix;
+        agrees with the per-policy evaluate_* methods up to float rounding.
+
+        Returns:
+            (N, 5) array of scores [-1, 1], columns in FoundationType order
+        """
+        scores = batch.features @ self.coefficients.T
+        scores += self.intercepts
+        scores *= 2
+        scores -= 1
+        return np.clip(scores, -1.0, 1.0, out=scores)
+
+    def _kernel_scores(self, row: np.ndarray) -> np.ndarray:
+        """Five foundation scores of one PolicyBatch row through the per-policy kernels"""
+        return np.array([
+            _care_harm_score(
+                *self._harm_args,
+                row[FeatureIdx.SAFETY_REQUIREMENTS], row[FeatureIdx.PRIVACY_SAFEGUARDS],
+                row[FeatureIdx.VULNERABLE_PROTECTION], row[FeatureIdx.HARM_PREVENTION],
+                row[FeatureIdx.IMPLEMENTATION_COST], row[FeatureIdx.ENFORCEMENT_DIFFICULTY]
+            ),
+            _fairness_cheating_score(
+                *self._fairness_args,
+                row[FeatureIdx.EQUITY_PROVISIONS], row[FeatureIdx.PROCEDURAL_FAIRNESS],
+                row[FeatureIdx.ACCESS_EQUALITY], row[FeatureIdx.SMALL_ACTOR_BURDEN]
+            ),
+            _loyalty_betrayal_score(
+                *self._loyalty_args,
+                row[FeatureIdx.NATIONAL_ADVANTAGE], row[FeatureIdx.COMPETITIVENESS_IMPACT],
+                row[FeatureIdx.CROSS_BORDER_COOPERATION], row[FeatureIdx.INGROUP_SOLIDARITY]
+            ),
+            _weighted_foundation_score(
+                *self._authority_args,
+                row[FeatureIdx.INSTITUTIONAL_CLARITY], row[FeatureIdx.REGULATORY_STRENGTH],
+                row[FeatureIdx.PRECEDENT_ALIGNMENT], row[FeatureIdx.EXPERT_DEFERENCE]
+            ),
+            _weighted_foundation_score(
+                *self._sanctity_args,
+                row[FeatureIdx.HUMAN_DIGNITY], row[FeatureIdx.PRIVACY_SANCTITY],
+                row[FeatureIdx.TRANSPARENCY_NORMS], row[FeatureIdx.MANIPULATION_PREVENTION]
+            )
+        ])
 
     def evaluate_all_foundations(self, policy: PolicyFeatures) -> Dict[str, float]:
         """
         Compute moral evaluation across all five foundations
 
+        Results are memoized per feature vector, so repeated evaluations of the
+        same policy (one per stakeholder) compute the foundations only once.
+
         Returns:
             Dictionary mapping foundation names to scores [-1, 1]
         """
-        return {
-            'care_harm': self.evaluate_care_harm(policy),
-            'fairness_cheating': self.evaluate_fairness_cheating(policy),
-            'loyalty_betrayal': self.evaluate_loyalty_betrayal(policy),
-            'authority_subversion': self.evaluate_authority_subversion(policy),
-            'sanctity_degradation': self.evaluate_sanctity_degradation(policy)
-        }
+        key = _policy_feature_values(policy)
+        scores = self._score_cache.get(key)
+        if scores is None:
+            if len(self._score_cache) >= SCORE_CACHE_SIZE:
+                self._score_cache.clear()
+            scores = self._score_cache[key] = {
+                'care_harm': self.evaluate_care_harm(policy),
+                'fairness_cheating': self.evaluate_fairness_cheating(policy),
+                'loyalty_betrayal': self.evaluate_loyalty_betrayal(policy),
+                'authority_subversion': self.evaluate_authority_subversion(policy),
+                'sanctity_degradation': self.evaluate_sanctity_degradation(policy)
+            }
+        return dict(scores)
 
     def compute_moral_value(self,
                            policy: PolicyFeatures,
-                           agent_foundations: MoralFoundations) -> float:
+                           agent_foundations,
+                           foundation_scores: Optional[Dict[str, float]] = None) -> float:
         """
         Compute overall moral value of policy for agent with specific foundation weights
 
@@ -337,26 +614,61 @@ class MoralEvaluator:
 
         Args:
             policy: Policy to evaluate
-            agent_foundations: Agent's moral foundation weights
+            agent_foundations: Agent's moral foundation weights, as MoralFoundations
+                or a (5,) array in FOUNDATION_ORDER (e.g. stakeholder_weights(name))
+            foundation_scores: Precomputed evaluate_all_foundations(policy), if at hand
 
         Returns:
             Weighted moral value [-1, 1]
         """
-        foundation_scores = self.evaluate_all_foundations(policy)
+        if foundation_scores is None:
+            foundation_scores = self.evaluate_all_foundations(policy)
+        care, fairness, loyalty, authority, sanctity = _foundation_weights(agent_foundations)
 
         moral_value = (
-            agent_foundations.care_harm * foundation_scores['care_harm'] +
-            agent_foundations.fairness_cheating * foundation_scores['fairness_cheating'] +
-            agent_foundations.loyalty_betrayal * foundation_scores['loyalty_betrayal'] +
-            agent_foundations.authority_subversion * foundation_scores['authority_subversion'] +
-            agent_foundations.sanctity_degradation * foundation_scores['sanctity_degradation']
+            care * foundation_scores['care_harm'] +
+            fairness * foundation_scores['fairness_cheating'] +
+            loyalty * foundation_scores['loyalty_betrayal'] +
+            authority * foundation_scores['authority_subversion'] +
+            sanctity * foundation_scores['sanctity_degradation']
         )
 
         return moral_value
 
+    def compute_moral_values(self,
+                             policy: PolicyFeatures,
+                             foundation_matrix: np.ndarray) -> np.ndarray:
+        """
+        Compute moral value of one policy for many agents at once
+
+        Args:
+            policy: Policy to evaluate
+            foundation_matrix: (K, 5) agent weights, one MoralFoundations.to_vector() per row
+
+        Returns:
+            Array of K weighted moral values [-1, 1]
+        """
+        foundation_scores = self.evaluate_all_foundations(policy)
+        return foundation_matrix @ np.array([foundation_scores[name] for name in FOUNDATION_ORDER])
+
+    def compute_moral_value_matrix(self,
+                                   batch: PolicyBatch,
+                                   foundation_matrix: np.ndarray) -> np.ndarray:
+        """
+        Compute moral value of every policy in a batch for many agents at once
+
+        Args:
+            batch: Policies to evaluate
+            foundation_matrix: (A, 5) agent weights, e.g. STAKEHOLDER_PROFILE_MATRIX
+
+        Returns:
+            (A, P) array of weighted moral values [-1, 1]
+        """
+        return foundation_matrix @ self.evaluate_batch(batch).T
+
     def check_moral_constraints(self,
                                 policy: PolicyFeatures,
-                                agent_foundations: MoralFoundations,
+                                agent_foundations,
                                 threshold: float = -0.5) -> Tuple[bool, List[str]]:
         """
         Check if policy violates any moral hard constraints
@@ -366,26 +678,55 @@ class MoralEvaluator:
 
         Args:
             policy: Policy to check
-            agent_foundations: Agent's moral weights
+            agent_foundations: Agent's moral weights, as MoralFoundations or a (5,) array
             threshold: Minimum acceptable score for any strongly-weighted foundation
 
         Returns:
             (is_admissible, list_of_violations)
         """
         foundation_scores = self.evaluate_all_foundations(policy)
-        violations = []
+        scores = np.array([foundation_scores[name] for name in FOUNDATION_ORDER])
+        weights = np.asarray(_foundation_weights(agent_foundations), dtype=float)
 
-        # Check if any strongly-weighted foundation is severely violated
-        for foundation_name, score in foundation_scores.items():
-            weight = getattr(agent_foundations, foundation_name)
-
-            # If agent weights this foundation highly (>0.25) and score is very negative
-            if weight > 0.25 and score < threshold:
-                violations.append(f"{foundation_name}: {score:.2f} (threshold: {threshold})")
+        # Strongly-weighted foundations (>0.25) that are severely violated
+        violated = np.flatnonzero((weights > 0.25) & (scores < threshold))
+        violations = [
+            f"{FOUNDATION_ORDER[i]}: {scores[i]:.2f} (threshold: {threshold})"
+            for i in violated
+        ]
 
         is_admissible = len(violations) == 0
         return is_admissible, violations
 
+    def check_admissible_batch(self,
+                               batch: PolicyBatch,
+                               foundation_matrix: np.ndarray,
+                               threshold: float = -0.5) -> np.ndarray:
+        """
+        Screen many policies against many agents' moral hard constraints at once
+
+        Same rule and result as check_moral_constraints (no foundation weighted
+        above 0.25 may score below threshold), broadcast over an (A, P, 5)
+        violation cube. The matmul scores can differ from the per-policy kernels
+        by a few ulps, so policies with a score within BATCH_RESCORE_MARGIN of the
+        threshold are re-scored with the kernels before comparing.
+
+        Args:
+            batch: PolicyBatch of P policies
+            foundation_matrix: (A, 5) weights, e.g. STAKEHOLDER_PROFILE_MATRIX
+            threshold: Minimum acceptable score for any strongly-weighted foundation
+
+        Returns:
+            (A, P) boolean array, True where the policy is admissible for the agent
+        """
+        scores = self.evaluate_batch(batch)
+        near_threshold = np.abs(scores - threshold) <= BATCH_RESCORE_MARGIN
+        for p in np.flatnonzero(near_threshold.any(axis=1)):
+            scores[p] = self._kernel_scores(batch.features[p])
+
+        violations = (foundation_matrix[:, None, :] > 0.25) & (scores[None, :, :] < threshold)
+        return ~violations.any(axis=-1)
+
 
 class MoralExplainer:
     """
@@ -404,7 +745,9 @@ class MoralExplainer:
         Generate natural language explanation of why agent supports/opposes policy
         """
         foundation_scores = self.evaluator.evaluate_all_foundations(policy)
-        moral_value = self.evaluator.compute_moral_value(policy, agent_foundations)
+        moral_value = self.evaluator.compute_moral_value(
+            policy, agent_foundations, foundation_scores=foundation_scores
+        )
 
         # Determine overall stance
         if moral_value > 0.3:
@@ -417,37 +760,35 @@ class MoralExplainer:
             stance = "strongly opposes"
 
         # Identify dominant foundation
-        weighted_scores = {
-            name: getattr(agent_foundations, name) * score
-            for name, score in foundation_scores.items()
-        }
-        dominant_foundation = max(weighted_scores, key=weighted_scores.get)
-        dominant_value = weighted_scores[dominant_foundation]
+        weights = np.asarray(_foundation_weights(agent_foundations), dtype=float)
+        scores = np.array([foundation_scores[name] for name in FOUNDATION_ORDER])
+        contributions = weights * scores
+        dominant_foundation = FOUNDATION_ORDER[int(np.argmax(contributions))]
 
         # Generate explanation
-        explanation = f"""
-{agent_name} {stance} "{policy.policy_name}" (Overall Moral Value: {moral_value:.2f})
-
-PRIMARY MORAL REASONING:
-{self._explain_foundation(dominant_foundation, foundation_scores[dominant_foundation], policy)}
-
-FOUNDATION BREAKDOWN:
-"""
-
-        for foundation_name, score in foundation_scores.items():
-            weight = getattr(agent_foundations, foundation_name)
-            contribution = weight * score
-            explanation += f"  • {foundation_name.replace('_', '/').title()}: "
-            explanation += f"{score:+.2f} (weight: {weight:.2f}, contribution: {contribution:+.2f})\n"
+        lines = [
+            "",
+            f'{agent_name} {stance} "{policy.policy_name}" (Overall Moral Value: {moral_value:.2f})',
+            "",
+            "PRIMARY MORAL REASONING:",
+            self._explain_foundation(dominant_foundation, foundation_scores[dominant_foundation], policy),
+            "",
+            "FOUNDATION BREAKDOWN:"
+        ]
+        lines.extend(
+            f"  • {FOUNDATION_LABELS[foundation_name]}: "
+            f"{score:+.2f} (weight: {weight:.2f}, contribution: {contribution:+.2f})"
+            for foundation_name, score, weight, contribution in zip(FOUNDATION_ORDER, scores, weights, contributions)
+        )
 
         # Identify moral conflicts
         conflicts = self._identify_conflicts(foundation_scores, agent_foundations)
         if conflicts:
-            explanation += "\nMORAL TENSIONS:\n"
-            for conflict in conflicts:
-                explanation += f"  • {conflict}\n"
+            lines.extend(["", "MORAL TENSIONS:"])
+            lines.extend(f"  • {conflict}" for conflict in conflicts)
 
-        return explanation
+        lines.append("")
+        return "\n".join(lines)
 
     def _explain_foundation(self, foundation: str, score: float, policy: PolicyFeatures) -> str:
         """Generate foundation-specific explanation"""
@@ -514,24 +855,20 @@ FOUNDATION BREAKDOWN:
                            foundation_scores: Dict[str, float],
                            agent_foundations: MoralFoundations) -> List[str]:
         """Identify moral tradeoffs where foundations conflict"""
-        conflicts = []
-
-        weighted = {k: getattr(agent_foundations, k) * v
-                   for k, v in foundation_scores.items()}
+        weighted = np.multiply(_foundation_weights(agent_foundations),
+                               [foundation_scores[name] for name in FOUNDATION_ORDER])
 
-        # Find foundations with significant weight that conflict
-        for f1, score1 in weighted.items():
-            for f2, score2 in weighted.items():
-                if f1 < f2:  # Avoid duplicates
-                    # If both weighted significantly but opposite signs
-                    if abs(score1) > 0.1 and abs(score2) > 0.1:
-                        if np.sign(score1) != np.sign(score2):
-                            conflicts.append(
-                                f"{f1.replace('_', '/').title()} ({score1:+.2f}) "
-                                f"conflicts with {f2.replace('_', '/').title()} ({score2:+.2f})"
-                            )
+        # Both weighted significantly but opposite signs, over every unordered pair
+        significant = np.abs(weighted) > 0.1
+        signs = np.sign(weighted)
+        mask = (significant[_CONFLICT_FIRST] & significant[_CONFLICT_SECOND] &
+                (signs[_CONFLICT_FIRST] != signs[_CONFLICT_SECOND]))
 
-        return conflicts
+        return [
+            f"{FOUNDATION_LABELS[FOUNDATION_ORDER[i]]} ({weighted[i]:+.2f}) "
+            f"conflicts with {FOUNDATION_LABELS[FOUNDATION_ORDER[j]]} ({weighted[j]:+.2f})"
+            for i, j in zip(_CONFLICT_FIRST[mask], _CONFLICT_SECOND[mask])
+        ]
 
 
 # ============================================================================
@@ -620,6 +957,17 @@ STAKEHOLDER_PROFILES = {
     )
 }
 
+# Profile weights stacked into one read-only (K, 5) matrix, rows in STAKEHOLDER_PROFILES order
+STAKEHOLDER_NAMES = tuple(STAKEHOLDER_PROFILES)
+STAKEHOLDER_PROFILE_INDEX = {key: i for i, key in enumerate(STAKEHOLDER_NAMES)}
+STAKEHOLDER_PROFILE_MATRIX = MoralFoundations.stack(list(STAKEHOLDER_PROFILES.values()))
+STAKEHOLDER_PROFILE_MATRIX.setflags(write=False)
+
+
+def stakeholder_weights(name: str) -> np.ndarray:
+    """Read-only (5,) view of a stakeholder's weights in FOUNDATION_ORDER"""
+    return STAKEHOLDER_PROFILE_MATRIX[STAKEHOLDER_PROFILE_INDEX[name]]
+
 
 # ============================================================================
 # EXAMPLE USAGE AND VALIDATION
@@ -718,12 +1066,10 @@ def run_validation_example():
     print("\nMoral similarity between stakeholders (lower = more similar):\n")
 
     # Compute pairwise moral distances
-    profile_list = list(stakeholders)
-    for i, (key1, name1) in enumerate(profile_list):
-        for key2, name2 in profile_list[i+1:]:
-            distance = STAKEHOLDER_PROFILES[key1].distance_to(STAKEHOLDER_PROFILES[key2])
-            print(f"{name1} ↔ {name2}: {distance:.3f}")
-
+    distances = squareform(pdist(MoralFoundations.stack([STAKEHOLDER_PROFILES[key] for key, _ in stakeholders])))
+    for i, (_, name1) in enumerate(stakeholders):
+        for j in range(i + 1, len(stakeholders)):
+            print(f"{name1} ↔ {stakeholders[j][1]}: {distances[i, j]:.3f}")
 
 if __name__ == "__main__":
     run_validation_example()
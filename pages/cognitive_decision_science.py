@@ -5,11 +5,133 @@ import plotly.express as px
 import numpy as np
 from scipy import stats
 
+# 8-stage policy development model; the last stage (Monitor/Measure) is ongoing
+POLICY_STAGES = ['Identify', 'Secure', 'Investigate/Explore', 'Collaborate/Negotiate',
+                 'Reason', 'Govern', 'Scale', 'Monitor/Measure']
+STAGE_ALPHAS = np.array([0.40, 0.35, 0.50, 0.45, 0.30, 0.25, 0.40, 0.35])
+STAGE_BASELINES = np.array([2, 3, 6, 8, 4, 12, 6])  # months, for the timed stages
+
+# 2-player game outcomes, indexed [Player 1 strategy][Player 2 strategy]
+NASH_OUTCOME_LABELS = [
+    ["(A, A) - Both act immediately", "(A, B) - Mixed strategies"],
+    ["(B, A) - Mixed strategies", "(B, B) - Both coordinate"]
+]
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _decision_outcomes(actors, time_horizon, discount_rate):
+    """Seeded utility simulation for (name, type, beta) actor tuples"""
+    np.random.seed(42)
+
+    names, types, betas = zip(*actors)
+    discount_factors = discount_rate ** np.arange(1, time_horizon + 1)
+
+    # One row per actor: immediate reward, then expected reward for each future period.
+    # Drawn in the same row-major order as one-at-a-time sampling, so results match.
+    low = np.concatenate(([0.3], np.full(time_horizon, 0.2)))
+    high = np.concatenate(([0.8], np.full(time_horizon, 0.7)))
+    draws = np.random.uniform(low, high, (len(actors), time_horizon + 1))
+    immediate_reward = draws[:, 0]
+
+    # Future rewards with discount
+    total_future = (discount_factors * draws[:, 1:]).sum(axis=1)
+
+    # Total utility
+    total_utility = immediate_reward + np.array(betas) * total_future
+
+    return pd.DataFrame({
+        'Actor': names,
+        'Type': types,
+        'Immediate Reward': immediate_reward,
+        'Future Value': total_future,
+        'Total Utility': total_utility
+    })
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _pareto_frontier(num_solutions, tradeoff, obj1_name, obj2_name):
+    """Seeded candidate solutions, their Pareto mask and the frontier chart"""
+    np.random.seed(42)
+
+    # Create candidate solutions
+    obj1_values = np.random.uniform(0, 1, num_solutions)
+
+    # Create trade-off (higher obj1 → lower obj2)
+    noise = np.random.normal(0, 0.1, num_solutions)
+    obj2_values = (1 - tradeoff * obj1_values) + noise
+    obj2_values = np.clip(obj2_values, 0, 1)
+
+    # Identify Pareto frontier with a skyline sweep: sorted by obj1 then obj2, both
+    # descending, a point is optimal iff its obj2 beats every point before it.
+    # Exact duplicates don't dominate each other, so they share their first copy's status.
+    order = np.lexsort((-obj2_values, -obj1_values))
+    sorted_obj1, sorted_obj2 = obj1_values[order], obj2_values[order]
+    best_before = np.maximum.accumulate(np.concatenate(([-np.inf], sorted_obj2[:-1])))
+    run_start = np.ones(num_solutions, dtype=bool)
+    run_start[1:] = (sorted_obj1[1:] != sorted_obj1[:-1]) | (sorted_obj2[1:] != sorted_obj2[:-1])
+    first_copy = np.maximum.accumulate(np.where(run_start, np.arange(num_solutions), 0))
+    pareto_mask = np.empty(num_solutions, dtype=bool)
+    pareto_mask[order] = (sorted_obj2 > best_before)[first_copy]
+
+    # Plot
+    fig = go.Figure()
+
+    # Non-Pareto points
+    fig.add_trace(go.Scatter(
+        x=obj1_values[~pareto_mask],
+        y=obj2_values[~pareto_mask],
+        mode='markers',
+        name='Dominated Solutions',
+        marker=dict(size=8, color='lightgray', opacity=0.5)
+    ))
+
+    # Pareto frontier
+    pareto_x = obj1_values[pareto_mask]
+    pareto_y = obj2_values[pareto_mask]
+    sorted_indices = np.argsort(pareto_x)
+
+    fig.add_trace(go.Scatter(
+        x=pareto_x[sorted_indices],
+        y=pareto_y[sorted_indices],
+        mode='markers+lines',
+        name='Pareto Frontier',
+        marker=dict(size=12, color='#667eea'),
+        line=dict(color='#667eea', width=2)
+    ))
+
+    fig.update_layout(
+        title="Pareto Frontier: Innovation vs Safety Trade-off",
+        xaxis_title=obj1_name,
+        yaxis_title=obj2_name,
+        height=500,
+        hovermode='closest'
+    )
+
+    return pareto_mask, fig
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _variance_decomposition(true_variance, error_variance, reliability):
+    """Donut chart splitting observed variance into true and error variance"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Pie(
+        labels=['True Score Variance', 'Error Variance'],
+        values=[true_variance, error_variance],
+        marker=dict(colors=['#667eea', '#ff6b6b']),
+        hole=0.4
+    ))
+
+    fig.update_layout(
+        title=f"Reliability = {reliability:.3f}",
+        height=400
+    )
+    return fig
+
 st.set_page_config(page_title="COGNITIVE DECISION SCIENCE", page_icon="🧮", layout="wide")
 
 # Password protection
-if 'authenticated' not in st.session_state:
-    st.session_state.authenticated = False
+st.session_state.setdefault('authenticated', False)
 
 if not st.session_state.authenticated:
     password = st.text_input("Enter password:", type="password")
@@ -128,34 +250,10 @@ with tab1:
         st.markdown("### Decision Outcomes")
 
         # Simulate decision outcomes
-        np.random.seed(42)
-
-        outcomes = []
-        for actor in actor_types:
-            # Immediate reward
-            immediate_reward = np.random.uniform(0.3, 0.8)
-
-            # Future rewards with discount
-            future_rewards = []
-            for k in range(1, time_horizon + 1):
-                expected_future = np.random.uniform(0.2, 0.7)
-                discounted = (discount_rate ** k) * expected_future
-                future_rewards.append(discounted)
-
-            total_future = sum(future_rewards)
-
-            # Total utility
-            total_utility = immediate_reward + actor['beta'] * total_future
-
-            outcomes.append({
-                'Actor': actor['name'],
-                'Type': actor['type'],
-                'Immediate Reward': immediate_reward,
-                'Future Value': total_future,
-                'Total Utility': total_utility
-            })
-
-        df_outcomes = pd.DataFrame(outcomes)
+        df_outcomes = _decision_outcomes(
+            tuple((actor['name'], actor['type'], actor['beta']) for actor in actor_types),
+            time_horizon, discount_rate
+        )
 
         # Display results
         st.dataframe(df_outcomes.style.background_gradient(subset=['Total Utility'], cmap='Greens'))
@@ -311,24 +409,13 @@ with tab2:
     st.subheader("🎯 Nash Equilibrium Analysis")
 
     try:
-        # Check for Nash Equilibria
-        equilibria = []
-
-        # Check (A, A)
-        if aa_p1 >= ba_p1 and aa_p2 >= ab_p2:
-            equilibria.append("(A, A) - Both act immediately")
-
-        # Check (A, B)
-        if ab_p1 >= bb_p1 and ab_p2 >= aa_p2:
-            equilibria.append("(A, B) - Mixed strategies")
-
-        # Check (B, A)
-        if ba_p1 >= aa_p1 and ba_p2 >= bb_p2:
-            equilibria.append("(B, A) - Mixed strategies")
-
-        # Check (B, B)
-        if bb_p1 >= ab_p1 and bb_p2 >= ba_p2:
-            equilibria.append("(B, B) - Both coordinate")
+        # Check for Nash Equilibria: cells where each player's strategy is a best
+        # response to the other's (rows = Player 1's strategy, columns = Player 2's)
+        payoffs_p1 = np.array([[aa_p1, ab_p1], [ba_p1, bb_p1]])
+        payoffs_p2 = np.array([[aa_p2, ab_p2], [ba_p2, bb_p2]])
+        equilibrium_mask = ((payoffs_p1 == payoffs_p1.max(axis=0, keepdims=True)) &
+                            (payoffs_p2 == payoffs_p2.max(axis=1, keepdims=True)))
+        equilibria = [NASH_OUTCOME_LABELS[i][j] for i, j in np.argwhere(equilibrium_mask)]
 
         if equilibria:
             st.success(f"""
@@ -408,58 +495,7 @@ with tab3:
 
     with col2:
         # Generate synthetic Pareto frontier
-        np.random.seed(42)
-
-        # Create candidate solutions
-        obj1_values = np.random.uniform(0, 1, num_solutions)
-
-        # Create trade-off (higher obj1 → lower obj2)
-        noise = np.random.normal(0, 0.1, num_solutions)
-        obj2_values = (1 - tradeoff * obj1_values) + noise
-        obj2_values = np.clip(obj2_values, 0, 1)
-
-        # Identify Pareto frontier
-        pareto_mask = np.ones(num_solutions, dtype=bool)
-        for i in range(num_solutions):
-            for j in range(num_solutions):
-                if i != j:
-                    if (obj1_values[j] >= obj1_values[i] and obj2_values[j] >= obj2_values[i]) and                        (obj1_values[j] > obj1_values[i] or obj2_values[j] > obj2_values[i]):
-                        pareto_mask[i] = False
-                        break
-
-        # Plot
-        fig = go.Figure()
-
-        # Non-Pareto points
-        fig.add_trace(go.Scatter(
-            x=obj1_values[~pareto_mask],
-            y=obj2_values[~pareto_mask],
-            mode='markers',
-            name='Dominated Solutions',
-            marker=dict(size=8, color='lightgray', opacity=0.5)
-        ))
-
-        # Pareto frontier
-        pareto_x = obj1_values[pareto_mask]
-        pareto_y = obj2_values[pareto_mask]
-        sorted_indices = np.argsort(pareto_x)
-
-        fig.add_trace(go.Scatter(
-            x=pareto_x[sorted_indices],
-            y=pareto_y[sorted_indices],
-            mode='markers+lines',
-            name='Pareto Frontier',
-            marker=dict(size=12, color='#667eea'),
-            line=dict(color='#667eea', width=2)
-        ))
-
-        fig.update_layout(
-            title="Pareto Frontier: Innovation vs Safety Trade-off",
-            xaxis_title=obj1_name,
-            yaxis_title=obj2_name,
-            height=500,
-            hovermode='closest'
-        )
+        pareto_mask, fig = _pareto_frontier(num_solutions, tradeoff, obj1_name, obj2_name)
 
         st.plotly_chart(fig, use_container_width=True)
 
@@ -517,10 +553,9 @@ with tab4:
 
         # Acceleration coefficients table
         stage_data = {
-            'Stage': ['Identify', 'Secure', 'Investigate/Explore', 'Collaborate/Negotiate',
-                     'Reason', 'Govern', 'Scale', 'Monitor/Measure'],
-            'α (Acceleration)': [0.40, 0.35, 0.50, 0.45, 0.30, 0.25, 0.40, 0.35],
-            'Typical Baseline (months)': [2, 3, 6, 8, 4, 12, 6, 'Ongoing']
+            'Stage': POLICY_STAGES,
+            'α (Acceleration)': STAGE_ALPHAS,
+            'Typical Baseline (months)': STAGE_BASELINES.tolist() + ['Ongoing']
         }
 
         df_stages = pd.DataFrame(stage_data)
@@ -537,46 +572,35 @@ with tab4:
         gwc_effectiveness = st.slider("g-GWC Effectiveness", 0.0, 1.0, 0.7, 0.05,
                                      help="Coordination effectiveness: 0 = no coordination, 1 = perfect")
 
-        baseline_times = {}
         st.markdown("### Baseline Times (months)")
-        for stage in stage_data['Stage'][:-1]:  # Exclude "Ongoing"
-            idx = stage_data['Stage'].index(stage)
-            default = stage_data['Typical Baseline (months)'][idx]
-            baseline_times[stage] = st.number_input(
+        timed_stages = POLICY_STAGES[:-1]  # Exclude "Ongoing"
+        baseline_arr = np.array([
+            st.number_input(
                 stage,
                 min_value=1,
                 max_value=24,
                 value=int(default),
                 key=f"baseline_{stage}"
             )
+            for stage, default in zip(timed_stages, STAGE_BASELINES)
+        ])
 
     with col2:
         st.markdown("### Timeline Results")
 
-        results = []
-        total_baseline = 0
-        total_agpo = 0
-
-        for stage in baseline_times:
-            idx = stage_data['Stage'].index(stage)
-            alpha = stage_data['α (Acceleration)'][idx]
-
-            baseline = baseline_times[stage]
-            agpo_time = baseline * (1 - alpha * gwc_effectiveness)
-            time_saved = baseline - agpo_time
-
-            total_baseline += baseline
-            total_agpo += agpo_time
+        agpo_arr = baseline_arr * (1 - STAGE_ALPHAS[:-1] * gwc_effectiveness)
+        saved_arr = baseline_arr - agpo_arr
 
-            results.append({
-                'Stage': stage,
-                'Baseline': baseline,
-                'AGPO Time': agpo_time,
-                'Time Saved': time_saved,
-                'Acceleration %': (time_saved / baseline) * 100
-            })
+        total_baseline = int(baseline_arr.sum())
+        total_agpo = agpo_arr.sum()
 
-        df_results = pd.DataFrame(results)
+        df_results = pd.DataFrame({
+            'Stage': timed_stages,
+            'Baseline': baseline_arr,
+            'AGPO Time': agpo_arr,
+            'Time Saved': saved_arr,
+            'Acceleration %': (saved_arr / baseline_arr) * 100
+        })
 
         # Display results
         st.dataframe(
@@ -743,21 +767,8 @@ with tab5:
             st.markdown("---")
             st.markdown("### Variance Decomposition")
 
-            fig = go.Figure()
-
-            fig.add_trace(go.Pie(
-                labels=['True Score Variance', 'Error Variance'],
-                values=[true_variance, error_variance],
-                marker=dict(colors=['#667eea', '#ff6b6b']),
-                hole=0.4
-            ))
-
-            fig.update_layout(
-                title=f"Reliability = {reliability:.3f}",
-                height=400
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(_variance_decomposition(true_variance, error_variance, reliability),
+                            use_container_width=True)
 
     # Interpretation guide
     st.markdown("---")
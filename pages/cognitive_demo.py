@@ -5,18 +5,51 @@ import plotly.express as px
 import numpy as np
 from moral_foundations import (
     MoralFoundations, PolicyFeatures, MoralEvaluator,
-    MoralExplainer, STAKEHOLDER_PROFILES
+    MoralExplainer, STAKEHOLDER_PROFILES, STAKEHOLDER_PROFILE_INDEX, STAKEHOLDER_PROFILE_MATRIX,
+    FOUNDATION_LABELS
 )
 from trust_dynamics import (
     TrustState, TrustDynamicsEngine, CoalitionManager,
     TrustBasedPolicyNegotiation, InteractionRecord, InteractionType
 )
 
+
+@st.cache_resource(show_spinner=False)
+def _get_evaluator(scenario_context):
+    return MoralEvaluator(scenario_context=scenario_context)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_explainer(scenario_context):
+    return MoralExplainer(_get_evaluator(scenario_context))
+
+
+@st.cache_data(show_spinner=False)
+def _profile_radar(profile_key):
+    """Radar chart of a stakeholder's moral foundation weights; profiles never change"""
+    found_dict = STAKEHOLDER_PROFILES[profile_key].to_dict()
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatterpolar(
+        r=list(found_dict.values()),
+        theta=[FOUNDATION_LABELS[k] for k in found_dict.keys()],
+        fill='toself',
+        name=profile_key.replace('_', ' ').title()
+    ))
+
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 0.5])),
+        showlegend=False,
+        height=400
+    )
+    return fig
+
+
 st.set_page_config(page_title="COGNITIVE ARCHITECTURE DEMO", page_icon="🧠", layout="wide")
 
 # Password protection
-if 'authenticated' not in st.session_state:
-    st.session_state.authenticated = False
+st.session_state.setdefault('authenticated', False)
 
 if not st.session_state.authenticated:
     password = st.text_input("Enter password:", type="password")
@@ -102,8 +135,8 @@ with tab1:
     with col2:
         st.subheader("Stakeholder Evaluations")
 
-        evaluator = MoralEvaluator(scenario_context="data_privacy")
-        explainer = MoralExplainer(evaluator)
+        evaluator = _get_evaluator("data_privacy")
+        explainer = _get_explainer("data_privacy")
 
         # Select stakeholders to compare
         selected_stakeholders = st.multiselect(
@@ -114,18 +147,15 @@ with tab1:
         )
 
         if selected_stakeholders:
-            # Compute moral values
-            results = []
-            for stakeholder_key in selected_stakeholders:
-                foundations = STAKEHOLDER_PROFILES[stakeholder_key]
-                moral_value = evaluator.compute_moral_value(policy, foundations)
-                results.append({
-                    'Stakeholder': stakeholder_key.replace('_', ' ').title(),
-                    'Moral Value': moral_value,
-                    'Stance': 'Support' if moral_value > 0 else 'Oppose'
-                })
+            # Compute moral values for all selected stakeholders in one matrix-vector product
+            rows = [STAKEHOLDER_PROFILE_INDEX[key] for key in selected_stakeholders]
+            moral_values = evaluator.compute_moral_values(policy, STAKEHOLDER_PROFILE_MATRIX[rows])
 
-            results_df = pd.DataFrame(results)
+            results_df = pd.DataFrame({
+                'Stakeholder': [key.replace('_', ' ').title() for key in selected_stakeholders],
+                'Moral Value': moral_values,
+                'Stance': np.where(moral_values > 0, 'Support', 'Oppose')
+            })
 
             # Visualization
             fig = px.bar(
@@ -204,6 +234,11 @@ with tab2:
             # Track trust evolution
             trust_history = []
 
+            # Draw every round's outcome noise up front
+            outcomes_i = (outcome + np.random.normal(0, 0.1, num_rounds)).tolist()
+            outcomes_j = (outcome + np.random.normal(0, 0.1, num_rounds)).tolist()
+            cooperation_levels = (cooperation_level + np.random.normal(0, 0.05, num_rounds)).tolist()
+
             for round_num in range(num_rounds):
                 # Create interaction
                 interaction = InteractionRecord(
@@ -211,9 +246,9 @@ with tab2:
                     agent_i=agent_a,
                     agent_j=agent_b,
                     interaction_type=InteractionType.NEGOTIATION,
-                    outcome_for_i=outcome + np.random.normal(0, 0.1),
-                    outcome_for_j=outcome + np.random.normal(0, 0.1),
-                    cooperation_level=cooperation_level + np.random.normal(0, 0.05)
+                    outcome_for_i=outcomes_i[round_num],
+                    outcome_for_j=outcomes_j[round_num],
+                    cooperation_level=cooperation_levels[round_num]
                 )
 
                 # Update trust
@@ -321,25 +356,7 @@ with tab3:
         # Show moral foundations profile
         st.markdown("#### Moral Foundations Profile")
 
-        foundations = STAKEHOLDER_PROFILES[agent_profile]
-        found_dict = foundations.to_dict()
-
-        fig = go.Figure()
-
-        fig.add_trace(go.Scatterpolar(
-            r=list(found_dict.values()),
-            theta=[k.replace('_', '/').title() for k in found_dict.keys()],
-            fill='toself',
-            name=agent_profile.replace('_', ' ').title()
-        ))
-
-        fig.update_layout(
-            polar=dict(radialaxis=dict(visible=True, range=[0, 0.5])),
-            showlegend=False,
-            height=400
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_profile_radar(agent_profile), use_container_width=True)
 
     with col2:
         st.markdown("#### Decision Weight Configuration")
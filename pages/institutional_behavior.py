@@ -1,10 +1,232 @@
 
+import sys
 import streamlit as st
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+BIAS_NAMES = ('Status Quo', 'Confirmation', 'Availability', 'Anchoring', 'Loss Aversion', 'Groupthink')
+
+STATIC_BLOCKS = {
+    'header': """
+<div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
+    <h3 style='color: white; margin: 0;'>Human-Inspired Organizational Cognition</h3>
+    <p style='color: white; margin: 5px 0 0 0; font-size: 14px;'>
+        Modeling real institutional decision-making patterns
+    </p>
+</div>
+""",
+    'overview': """
+### 🎯 Module Overview
+
+This page demonstrates three key institutional behavior modules that capture how real
+organizations make decisions under constraints, biases, and resistance to change.
+
+**Modules:**
+1. **🧠 Bounded Rationality Engine** - Herbert Simon's satisficing theory
+2. **🎭 Cognitive Bias System** - 6 organizational biases
+3. **⚙️ Organizational Inertia Modeling** - Change resistance patterns
+""",
+    'br_intro': """
+**Theoretical Foundation:** Herbert Simon's satisficing theory
+
+Organizations don't optimize—they **satisfice** (satisfy + suffice). They search for
+"good enough" solutions within cognitive and resource constraints.
+""",
+    'br_insights': """
+**Key Insights:**
+- Organizations stop searching when they find "good enough" (green bars)
+- Cognitive load reduces perceived quality of alternatives
+- Satisficing ≠ optimizing (may miss better options evaluated later)
+""",
+    'cb_intro': """
+**Six Organizational Biases:**
+
+Organizations systematically deviate from rational decision-making due to cognitive biases.
+""",
+    'inertia_intro': """
+**Theoretical Foundation:** Change resistance patterns
+
+Organizations resist change due to:
+- Structural inertia (established procedures, roles, systems)
+- Cultural inertia (norms, values, identity)
+- Political inertia (power structures, coalitions)
+""",
+    'inertia_insights': """
+**Key Insights:**
+- High inertia delays change adoption (flat initial curve)
+- External pressure and leadership commitment can overcome inertia
+- S-curve pattern: slow start → rapid adoption → plateau
+""",
+    'scenario_intro': """
+### Real-World Scenario: EU AI Act Implementation
+
+Watch how all three modules interact when an organization faces implementing the EU AI Act.
+""",
+    'footer': """
+<div style='text-align: center; padding: 20px;'>
+    <h3>🏛️ Auracelle Bach | Institutional Behavior Modules</h3>
+    <p><strong>Human-Inspired Organizational Cognition</strong></p>
+    <p style='font-size: 12px;'>Bounded Rationality • Cognitive Biases • Organizational Inertia</p>
+    <p style='font-size: 10px; color: #666;'>
+        Based on: Simon (1956) • Kahneman & Tversky (1979) • Hannan & Freeman (1984)
+    </p>
+</div>
+"""
+}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class Bias:
+    description: str
+    impact: str
+    example: str
+
+
+@st.cache_resource(show_spinner=False)
+def _bias_catalog():
+    """Bias definitions, shared across reruns and sessions"""
+    return {
+        "Status Quo Bias": Bias(
+            description="Preference for current state; resistance to change",
+            impact="Underweights benefits of new policies",
+            example="Keeping legacy AI governance despite better alternatives"
+        ),
+        "Confirmation Bias": Bias(
+            description="Seeking information that confirms existing beliefs",
+            impact="Ignores contradictory evidence",
+            example="Only reviewing studies supporting current approach"
+        ),
+        "Availability Bias": Bias(
+            description="Overweighting easily recalled information",
+            impact="Recent/dramatic events dominate decisions",
+            example="Overreacting to recent AI incident"
+        ),
+        "Anchoring Bias": Bias(
+            description="Over-relying on first piece of information",
+            impact="Initial proposals constrain negotiation range",
+            example="First country's proposal sets agenda"
+        ),
+        "Loss Aversion": Bias(
+            description="Losses loom larger than equivalent gains",
+            impact="Risk-averse decision-making",
+            example="Rejecting beneficial but uncertain AI policy"
+        ),
+        "Groupthink": Bias(
+            description="Conformity pressure suppresses dissent",
+            impact="Poor decisions due to consensus pressure",
+            example="Committee adopts flawed policy to maintain harmony"
+        )
+    }
+
+
+def _quantize(value, step):
+    """Snap slider values onto their step grid so cache keys don't vary by float noise"""
+    return np.round(np.round(value / step) * step, 10)
+
+
+@lru_cache(maxsize=64)
+def _bias_strength_metrics(bias_strength):
+    """Formatted metric strings for a single bias at the given intensity"""
+    rational_score = 0.8  # Unbiased decision quality
+    biased_score = rational_score * (1 - bias_strength * 0.4)
+    return {
+        'rational': f"{rational_score:.2f}",
+        'biased': f"{biased_score:.2f}",
+        'delta': f"{biased_score - rational_score:.2f}",
+        'adjustment': f"""
+    **Adjustment:** Decision quality reduced by {(rational_score - biased_score)*100:.1f}%
+    """
+    }
+
+
+@lru_cache(maxsize=128)
+def _qualities(search_depth, cognitive_load_pct):
+    """Quality of each alternative; independent of the aspiration level"""
+    rng = np.random.RandomState(42)
+    qualities = rng.beta(2, 2, size=search_depth) * (1 - cognitive_load_pct / 100 * 0.5)
+    qualities.setflags(write=False)
+    return qualities
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _search_fig(qualities, meets, aspiration_level):
+    """Plotly figure for the satisficing search bar chart"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=[f'Option {i+1}' for i in range(len(qualities))],
+        y=qualities.astype(np.float32),
+        marker=dict(color=meets.astype(np.int8), colorscale=[[0, 'red'], [1, 'green']], cmin=0, cmax=1),
+        texttemplate='%{y:.2f}',
+        textposition='auto',
+    ))
+
+    fig.add_hline(y=aspiration_level, line_dash="dash", line_color="blue",
+                  annotation_text="Aspiration Level", annotation_position="right")
+
+    fig.update_layout(
+        title="Bounded Rationality: Search Process",
+        xaxis_title="Alternatives (evaluated in order)",
+        yaxis_title="Quality Score",
+        yaxis_range=[0, 1],
+        height=400,
+        uirevision='static'
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _bias_profile_fig(bias_values, combined_bias):
+    """Plotly figure for the bar chart of the six bias strengths"""
+    fig = go.Figure(go.Bar(
+        x=BIAS_NAMES,
+        y=bias_values,
+        marker=dict(color=bias_values, colorscale='Reds', colorbar=dict(title='Strength')),
+    ))
+    fig.update_layout(
+        title=f"Bias Profile (Combined Effect: {combined_bias:.2%} reduction)",
+        xaxis_title="Bias",
+        yaxis_title="Strength",
+        height=400,
+        uirevision='static'
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _adoption_fig(time_periods, adoption_curve):
+    """Plotly figure for the change adoption S-curve"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Scattergl(
+        x=time_periods,
+        y=adoption_curve.astype(np.float32),
+        mode='lines',
+        name='Adoption Rate',
+        line=dict(color='blue', width=3)
+    ))
+
+    # Add resistance threshold
+    fig.add_hline(y=0.5, line_dash="dash", line_color="red",
+                  annotation_text="50% Adoption", annotation_position="right")
+
+    fig.update_layout(
+        title="Organizational Change Adoption Over Time",
+        xaxis_title="Months",
+        yaxis_title="Adoption Rate",
+        yaxis_range=[0, 1],
+        height=400
+    )
+    return fig
+
 
 st.set_page_config(page_title="INSTITUTIONAL BEHAVIOR", page_icon="🏛️", layout="wide")
 
@@ -12,8 +234,7 @@ st.set_page_config(page_title="INSTITUTIONAL BEHAVIOR", page_icon="🏛️", lay
 # PASSWORD PROTECTION
 # =============================================================================
 
-if 'authenticated' not in st.session_state:
-    st.session_state.authenticated = False
+st.session_state.setdefault('authenticated', False)
 
 if not st.session_state.authenticated:
     st.title("🔐 Auracelle Bach - Institutional Behavior Modules")
@@ -31,247 +252,141 @@ if not st.session_state.authenticated:
 # =============================================================================
 
 st.title("🏛️ Institutional Behavior Modules")
-st.markdown("""
-<div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
-    <h3 style='color: white; margin: 0;'>Human-Inspired Organizational Cognition</h3>
-    <p style='color: white; margin: 5px 0 0 0; font-size: 14px;'>
-        Modeling real institutional decision-making patterns
-    </p>
-</div>
-""", unsafe_allow_html=True)
-
-st.markdown("""
-### 🎯 Module Overview
+st.markdown(STATIC_BLOCKS['header'], unsafe_allow_html=True)
 
-This page demonstrates three key institutional behavior modules that capture how real
-organizations make decisions under constraints, biases, and resistance to change.
-
-**Modules:**
-1. **🧠 Bounded Rationality Engine** - Herbert Simon's satisficing theory
-2. **🎭 Cognitive Bias System** - 6 organizational biases
-3. **⚙️ Organizational Inertia Modeling** - Change resistance patterns
-""")
+st.markdown(STATIC_BLOCKS['overview'])
 
 # =============================================================================
 # MODULE 1: BOUNDED RATIONALITY ENGINE
 # =============================================================================
 
-st.markdown("---")
+st.divider()
 st.header("1. 🧠 Bounded Rationality Engine")
 
-st.markdown("""
-**Theoretical Foundation:** Herbert Simon's satisficing theory
+st.markdown(STATIC_BLOCKS['br_intro'])
 
-Organizations don't optimize—they **satisfice** (satisfy + suffice). They search for
-"good enough" solutions within cognitive and resource constraints.
-""")
 
-col1, col2 = st.columns(2)
-
-with col1:
-    st.markdown("#### Parameters")
+@st.fragment
+def _bounded_rationality():
+    """Module 1 sliders, decision and chart; reruns on its own"""
+    col1, col2 = st.columns(2)
 
-    aspiration_level = st.slider(
-        "Aspiration Level (minimum acceptable)",
-        0.0, 1.0, 0.7, 0.05,
-        help="Minimum performance threshold for acceptance"
-    )
+    with col1:
+        st.markdown("#### Parameters")
 
-    search_depth = st.slider(
-        "Search Depth (alternatives considered)",
-        1, 20, 5, 1,
-        help="Number of alternatives to evaluate before stopping"
-    )
+        aspiration_level = _quantize(st.slider(
+            "Aspiration Level (minimum acceptable)",
+            0.0, 1.0, 0.7, 0.05,
+            help="Minimum performance threshold for acceptance"
+        ), 0.05)
 
-    cognitive_load = st.slider(
-        "Cognitive Load (processing constraints)",
-        0.0, 1.0, 0.5, 0.05,
-        help="Higher values = more limited processing capacity"
-    )
+        search_depth = st.slider(
+            "Search Depth (alternatives considered)",
+            1, 20, 5, 1,
+            help="Number of alternatives to evaluate before stopping"
+        )
 
-with col2:
-    st.markdown("#### Decision Simulation")
+        cognitive_load = _quantize(st.slider(
+            "Cognitive Load (processing constraints)",
+            0.0, 1.0, 0.5, 0.05,
+            help="Higher values = more limited processing capacity"
+        ), 0.05)
 
-    # Simulate bounded rationality decision-making
-    np.random.seed(42)
+    with col2:
+        st.markdown("#### Decision Simulation")
 
-    alternatives = []
-    for i in range(search_depth):
-        # Quality decreases with cognitive load
-        base_quality = np.random.beta(2, 2)
-        adjusted_quality = base_quality * (1 - cognitive_load * 0.5)
+        # Simulate bounded rationality decision-making
+        qualities = _qualities(search_depth, round(cognitive_load * 100))
+        meets = qualities >= aspiration_level
+        names = [f'Option {i+1}' for i in range(search_depth)]
 
-        alternatives.append({
-            'Alternative': f'Option {i+1}',
-            'Quality': adjusted_quality,
-            'Meets Aspiration': adjusted_quality >= aspiration_level
-        })
+        # Find first satisficing option
+        if meets.any():
+            selected = int(meets.argmax())
+            optimal = int(qualities.argmax())
 
-    df_alternatives = pd.DataFrame(alternatives)
+            st.success(f"✅ Selected: {names[selected]} " +
+                      f"(Quality: {qualities[selected]:.2f})")
 
-    # Find first satisficing option
-    satisficing_idx = df_alternatives[df_alternatives['Meets Aspiration']].index
+            if selected != optimal:
+                st.warning(f"⚠️ Not optimal! Best option was {names[optimal]} " +
+                          f"(Quality: {qualities[optimal]:.2f})")
+            else:
+                st.info("🎯 Satisficing solution is also optimal!")
+        else:
+            st.error("❌ No alternatives meet aspiration level - search continues or threshold lowers")
 
-    if len(satisficing_idx) > 0:
-        selected = satisficing_idx[0]
-        optimal = df_alternatives['Quality'].idxmax()
+    # Visualization
+    st.plotly_chart(_search_fig(qualities, meets, aspiration_level), use_container_width=True)
 
-        st.success(f"✅ Selected: {df_alternatives.iloc[selected]['Alternative']} " +
-                  f"(Quality: {df_alternatives.iloc[selected]['Quality']:.2f})")
 
-        if selected != optimal:
-            st.warning(f"⚠️ Not optimal! Best option was {df_alternatives.iloc[optimal]['Alternative']} " +
-                      f"(Quality: {df_alternatives.iloc[optimal]['Quality']:.2f})")
-        else:
-            st.info("🎯 Satisficing solution is also optimal!")
-    else:
-        st.error("❌ No alternatives meet aspiration level - search continues or threshold lowers")
+_bounded_rationality()
 
-# Visualization
-fig = go.Figure()
-
-fig.add_trace(go.Bar(
-    x=df_alternatives['Alternative'],
-    y=df_alternatives['Quality'],
-    marker_color=['green' if m else 'red' for m in df_alternatives['Meets Aspiration']],
-    text=[f"{q:.2f}" for q in df_alternatives['Quality']],
-    textposition='auto',
-))
-
-fig.add_hline(y=aspiration_level, line_dash="dash", line_color="blue",
-              annotation_text="Aspiration Level", annotation_position="right")
-
-fig.update_layout(
-    title="Bounded Rationality: Search Process",
-    xaxis_title="Alternatives (evaluated in order)",
-    yaxis_title="Quality Score",
-    yaxis_range=[0, 1],
-    height=400
-)
-
-st.plotly_chart(fig, use_container_width=True)
-
-st.markdown("""
-**Key Insights:**
-- Organizations stop searching when they find "good enough" (green bars)
-- Cognitive load reduces perceived quality of alternatives
-- Satisficing ≠ optimizing (may miss better options evaluated later)
-""")
+st.markdown(STATIC_BLOCKS['br_insights'])
 
 # =============================================================================
 # MODULE 2: COGNITIVE BIAS SYSTEM
 # =============================================================================
 
-st.markdown("---")
+st.divider()
 st.header("2. 🎭 Cognitive Bias System")
 
-st.markdown("""
-**Six Organizational Biases:**
+st.markdown(STATIC_BLOCKS['cb_intro'])
 
-Organizations systematically deviate from rational decision-making due to cognitive biases.
-""")
-
-# Bias definitions
-biases = {
-    "Status Quo Bias": {
-        "description": "Preference for current state; resistance to change",
-        "impact": "Underweights benefits of new policies",
-        "example": "Keeping legacy AI governance despite better alternatives"
-    },
-    "Confirmation Bias": {
-        "description": "Seeking information that confirms existing beliefs",
-        "impact": "Ignores contradictory evidence",
-        "example": "Only reviewing studies supporting current approach"
-    },
-    "Availability Bias": {
-        "description": "Overweighting easily recalled information",
-        "impact": "Recent/dramatic events dominate decisions",
-        "example": "Overreacting to recent AI incident"
-    },
-    "Anchoring Bias": {
-        "description": "Over-relying on first piece of information",
-        "impact": "Initial proposals constrain negotiation range",
-        "example": "First country's proposal sets agenda"
-    },
-    "Loss Aversion": {
-        "description": "Losses loom larger than equivalent gains",
-        "impact": "Risk-averse decision-making",
-        "example": "Rejecting beneficial but uncertain AI policy"
-    },
-    "Groupthink": {
-        "description": "Conformity pressure suppresses dissent",
-        "impact": "Poor decisions due to consensus pressure",
-        "example": "Committee adopts flawed policy to maintain harmony"
-    }
-}
+biases = _bias_catalog()
 
 # Interactive bias selector
-selected_bias = st.selectbox("Select Bias to Explore:", list(biases.keys()))
+selected_bias = st.selectbox("Select Bias to Explore:", biases.keys())
+bias = biases[selected_bias]
 
 col1, col2 = st.columns([1, 1])
 
 with col1:
     st.markdown(f"#### {selected_bias}")
-    st.markdown(f"**Definition:** {biases[selected_bias]['description']}")
-    st.markdown(f"**Impact:** {biases[selected_bias]['impact']}")
-    st.markdown(f"**Example:** {biases[selected_bias]['example']}")
+    st.markdown(f"**Definition:** {bias.description}")
+    st.markdown(f"**Impact:** {bias.impact}")
+    st.markdown(f"**Example:** {bias.example}")
 
 with col2:
     st.markdown("#### Bias Strength Simulation")
 
-    bias_strength = st.slider(
+    bias_strength = _quantize(st.slider(
         "Bias Intensity",
         0.0, 1.0, 0.5, 0.05,
         help="How strongly this bias affects decisions"
-    )
+    ), 0.05)
 
     # Simulate bias impact on decision quality
-    rational_score = 0.8  # Unbiased decision quality
-    biased_score = rational_score * (1 - bias_strength * 0.4)
+    bias_metrics = _bias_strength_metrics(bias_strength)
 
-    st.metric("Rational Decision Quality", f"{rational_score:.2f}")
-    st.metric("Biased Decision Quality", f"{biased_score:.2f}",
-              delta=f"{biased_score - rational_score:.2f}")
+    st.metric("Rational Decision Quality", bias_metrics['rational'])
+    st.metric("Biased Decision Quality", bias_metrics['biased'],
+              delta=bias_metrics['delta'])
 
     # Show bias adjustment
-    st.markdown(f"""
-    **Adjustment:** Decision quality reduced by {(rational_score - biased_score)*100:.1f}%
-    """)
+    st.markdown(bias_metrics['adjustment'])
 
 # Multi-bias interaction
 st.markdown("#### Multi-Bias Interaction")
 
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    status_quo = st.slider("Status Quo", 0.0, 1.0, 0.3, 0.1, key='sq')
-    confirmation = st.slider("Confirmation", 0.0, 1.0, 0.3, 0.1, key='cf')
-
-with col2:
-    availability = st.slider("Availability", 0.0, 1.0, 0.3, 0.1, key='av')
-    anchoring = st.slider("Anchoring", 0.0, 1.0, 0.3, 0.1, key='an')
-
-with col3:
-    loss_aversion = st.slider("Loss Aversion", 0.0, 1.0, 0.3, 0.1, key='la')
-    groupthink = st.slider("Groupthink", 0.0, 1.0, 0.3, 0.1, key='gt')
+with st.form("bias_form"):
+    edited_biases = st.data_editor(
+        pd.DataFrame({'Bias': BIAS_NAMES, 'Strength': 0.3}),
+        key='bias_editor',
+        hide_index=True,
+        disabled=['Bias'],
+        column_config={
+            'Strength': st.column_config.NumberColumn(min_value=0.0, max_value=1.0, step=0.1, required=True)
+        }
+    )
+    st.form_submit_button("Update Bias Profile")
 
 # Calculate combined bias effect
-bias_values = [status_quo, confirmation, availability, anchoring, loss_aversion, groupthink]
-combined_bias = 1 - np.prod([1 - b*0.15 for b in bias_values])
+bias_values = _quantize(edited_biases['Strength'].fillna(0.0).to_numpy(), 0.1)
+combined_bias = 1 - np.prod(1 - bias_values * 0.15)
 
 # Visualization
-bias_df = pd.DataFrame({
-    'Bias': ['Status Quo', 'Confirmation', 'Availability', 'Anchoring', 'Loss Aversion', 'Groupthink'],
-    'Strength': bias_values
-})
-
-fig = px.bar(bias_df, x='Bias', y='Strength',
-             title=f"Bias Profile (Combined Effect: {combined_bias:.2%} reduction)",
-             color='Strength',
-             color_continuous_scale='Reds')
-fig.update_layout(height=400)
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(_bias_profile_fig(bias_values, combined_bias), use_container_width=True)
 
 st.markdown(f"""
 **Combined Impact:** With these bias levels, organizational decision quality is reduced by
@@ -282,17 +397,10 @@ approximately **{combined_bias*100:.1f}%** from the rational baseline.
 # MODULE 3: ORGANIZATIONAL INERTIA MODELING
 # =============================================================================
 
-st.markdown("---")
+st.divider()
 st.header("3. ⚙️ Organizational Inertia Modeling")
 
-st.markdown("""
-**Theoretical Foundation:** Change resistance patterns
-
-Organizations resist change due to:
-- Structural inertia (established procedures, roles, systems)
-- Cultural inertia (norms, values, identity)
-- Political inertia (power structures, coalitions)
-""")
+st.markdown(STATIC_BLOCKS['inertia_intro'])
 
 col1, col2 = st.columns(2)
 
@@ -302,14 +410,14 @@ with col1:
     org_age = st.slider("Organization Age (years)", 1, 50, 15, 1,
                        help="Older organizations have stronger inertia")
 
-    change_magnitude = st.slider("Change Magnitude", 0.0, 1.0, 0.5, 0.05,
-                                 help="How radical is the proposed change")
+    change_magnitude = _quantize(st.slider("Change Magnitude", 0.0, 1.0, 0.5, 0.05,
+                                           help="How radical is the proposed change"), 0.05)
 
-    external_pressure = st.slider("External Pressure", 0.0, 1.0, 0.3, 0.05,
-                                  help="Environmental forces demanding change")
+    external_pressure = _quantize(st.slider("External Pressure", 0.0, 1.0, 0.3, 0.05,
+                                            help="Environmental forces demanding change"), 0.05)
 
-    leadership_commitment = st.slider("Leadership Commitment", 0.0, 1.0, 0.6, 0.05,
-                                     help="How committed leadership is to change")
+    leadership_commitment = _quantize(st.slider("Leadership Commitment", 0.0, 1.0, 0.6, 0.05,
+                                                help="How committed leadership is to change"), 0.05)
 
 with col2:
     st.markdown("#### Inertia Calculation")
@@ -331,7 +439,7 @@ with col2:
     st.metric("Structural Inertia", f"{structural_inertia:.2f}")
     st.metric("Cultural Inertia", f"{cultural_inertia:.2f}")
     st.metric("Political Inertia", f"{political_inertia:.2f}")
-    st.markdown("---")
+    st.divider()
     st.metric("Total Change Resistance", f"{change_resistance:.2f}")
     st.metric("Change Success Probability", f"{change_success_prob:.2%}")
 
@@ -339,60 +447,23 @@ with col2:
 st.markdown("#### Change Adoption Timeline")
 
 time_periods = np.arange(0, 24, 1)  # 24 months
-adoption_curve = []
-
-for t in time_periods:
-    # S-curve adoption with inertia delay
-    time_adjusted = t - (change_resistance * 6)  # Inertia delays adoption
-    if time_adjusted < 0:
-        adoption = 0
-    else:
-        adoption = change_success_prob / (1 + np.exp(-0.4 * (time_adjusted - 8)))
-    adoption_curve.append(adoption)
-
-fig = go.Figure()
-
-fig.add_trace(go.Scatter(
-    x=time_periods,
-    y=adoption_curve,
-    mode='lines',
-    name='Adoption Rate',
-    line=dict(color='blue', width=3)
-))
-
-# Add resistance threshold
-fig.add_hline(y=0.5, line_dash="dash", line_color="red",
-              annotation_text="50% Adoption", annotation_position="right")
-
-fig.update_layout(
-    title="Organizational Change Adoption Over Time",
-    xaxis_title="Months",
-    yaxis_title="Adoption Rate",
-    yaxis_range=[0, 1],
-    height=400
-)
-
-st.plotly_chart(fig, use_container_width=True)
-
-st.markdown("""
-**Key Insights:**
-- High inertia delays change adoption (flat initial curve)
-- External pressure and leadership commitment can overcome inertia
-- S-curve pattern: slow start → rapid adoption → plateau
-""")
+# S-curve adoption with inertia delay
+time_adjusted = time_periods - (change_resistance * 6)  # Inertia delays adoption
+adoption_curve = np.where(time_adjusted < 0, 0.0,
+                          change_success_prob / (1 + np.exp(-0.4 * (time_adjusted - 8))))
+
+st.plotly_chart(_adoption_fig(time_periods, adoption_curve), use_container_width=True)
+
+st.markdown(STATIC_BLOCKS['inertia_insights'])
 
 # =============================================================================
 # INTEGRATED DEMONSTRATION
 # =============================================================================
 
-st.markdown("---")
+st.divider()
 st.header("🎯 Integrated Demonstration")
 
-st.markdown("""
-### Real-World Scenario: EU AI Act Implementation
-
-Watch how all three modules interact when an organization faces implementing the EU AI Act.
-""")
+st.markdown(STATIC_BLOCKS['scenario_intro'])
 
 col1, col2, col3 = st.columns(3)
 
@@ -418,6 +489,9 @@ with col3:
     st.markdown("- Political: Department conflicts")
 
 # Simulation results
+# Not a fragment: it has no widgets of its own and reads combined_bias and
+# change_resistance from Modules 2 and 3, so it only needs to rerun when they
+# do, and those modules already run in the main script pass.
 st.markdown("#### Simulation Results")
 
 # Simulate combined effect
@@ -453,14 +527,5 @@ with col2:
 # FOOTER
 # =============================================================================
 
-st.markdown("---")
-st.markdown("""
-<div style='text-align: center; padding: 20px;'>
-    <h3>🏛️ Auracelle Bach | Institutional Behavior Modules</h3>
-    <p><strong>Human-Inspired Organizational Cognition</strong></p>
-    <p style='font-size: 12px;'>Bounded Rationality • Cognitive Biases • Organizational Inertia</p>
-    <p style='font-size: 10px; color: #666;'>
-        Based on: Simon (1956) • Kahneman & Tversky (1979) • Hannan & Freeman (1984)
-    </p>
-</div>
-""", unsafe_allow_html=True)
+st.divider()
+st.html(STATIC_BLOCKS['footer'])
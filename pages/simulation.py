@@ -252,8 +252,7 @@ st.info("""
 ⚠️ Note: If live APIs are unavailable, the system automatically uses validated static fallback data.
 """)
 
-if "round" not in st.session_state:
-    st.session_state["round"] = 1
+st.session_state.setdefault("round", 1)
 
 # Sidebar Configuration
 st.sidebar.markdown("### 🎯 SCENARIO CONFIGURATION")
@@ -287,10 +286,7 @@ selected_policy = None
 selected_country_a = None
 selected_country_b = None
 
-if "policies" not in st.session_state:
-    st.session_state["policies"] = ["AI Ethics", "AI Safety", "Data Privacy", "Export Controls", "R&D Investment"]
-
-policies = st.session_state["policies"]
+policies = st.session_state.setdefault("policies", ["AI Ethics", "AI Safety", "Data Privacy", "Export Controls", "R&D Investment"])
 
 if scenario_type == "Bilateral Policy Negotiation":
     st.sidebar.subheader("🌍 Bilateral Actors")
@@ -734,17 +730,14 @@ with tab5:
 
         st.metric("Network Cascade Probability", f"{diffusion['cascade_probability']:.1%}")
 
-        # Trajectory visualization
-        traj_data = []
-        for round_idx, state in enumerate(diffusion['trajectory']):
-            for country, adoption in state.items():
-                traj_data.append({
-                    'Round': round_idx,
-                    'Country': country,
-                    'Adoption': adoption
-                })
-
-        traj_df = pd.DataFrame(traj_data)
+        # Trajectory visualization, in long form straight from the (rounds + 1, N) state array
+        trajectory = diffusion['trajectory']
+        traj_df = (
+            pd.DataFrame(trajectory.states, columns=trajectory.countries)
+            .rename_axis('Round')
+            .reset_index()
+            .melt(id_vars='Round', var_name='Country', value_name='Adoption')
+        )
 
         fig = px.line(
             traj_df,
@@ -920,7 +913,11 @@ with tab8:
 
         # History visualization
         if len(state['history']) > 1:
-            history_df = pd.DataFrame(state['history'], columns=['Step', 'Estimate', 'Uncertainty'])
+            history_df = (
+                pd.DataFrame(state['history'].values, columns=['Estimate', 'Uncertainty'])
+                .rename_axis('Step')
+                .reset_index()
+            )
 
             fig = go.Figure()
             fig.add_trace(go.Scatter(
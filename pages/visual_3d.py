@@ -8,8 +8,7 @@ st.set_page_config(page_title="3D Governance Visualization", page_icon="🌍", l
 # PASSWORD PROTECTION
 # =============================================================================
 
-if 'authenticated' not in st.session_state:
-    st.session_state.authenticated = False
+st.session_state.setdefault('authenticated', False)
 
 if not st.session_state.authenticated:
     st.title("🔐 Auracelle Bach - 3D Coordination Visualization")
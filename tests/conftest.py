@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the root-level modules (moral_foundations, bach_api_utils, ...) importable from tests/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,46 @@
+import pytest
+
+from bach_api_utils import BachGovernanceAPI, DataIngress
+
+COUNTRIES = ["USA", "CHN", "GBR"]
+MEASUREMENTS = [0.9, 0.4, 0.65]
+INTERVENTIONS = [0.2, 0.0, 0.5]
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Make every Phase 2 source unreachable so BachGovernanceAPI() builds from the static fallback"""
+    monkeypatch.setattr(DataIngress, "fetch_with_retry", lambda self, url, headers=None, timeout=30: None)
+
+
+def test_kalman_update_batch_matches_sequential_updates(offline):
+    batch_api = BachGovernanceAPI()
+    sequential_api = BachGovernanceAPI()
+
+    batch = batch_api.kalman_update_batch(COUNTRIES, MEASUREMENTS, INTERVENTIONS)
+    sequential = {
+        iso: sequential_api.kalman_update(iso, z, u)
+        for iso, z, u in zip(COUNTRIES, MEASUREMENTS, INTERVENTIONS)
+    }
+
+    assert batch == sequential
+    for iso in COUNTRIES:
+        batch_state = batch_api.kalman_states[iso]
+        sequential_state = sequential_api.kalman_states[iso]
+        assert batch_state["x_hat"] == pytest.approx(sequential_state["x_hat"], abs=1e-12)
+        assert batch_state["P"] == pytest.approx(sequential_state["P"], abs=1e-12)
+        assert len(batch_state["history"]) == len(sequential_state["history"])
+
+
+def test_kalman_update_batch_rejects_repeated_countries(offline):
+    api = BachGovernanceAPI()
+    api.initialize_kalman_filter("USA")
+    before = dict(api.kalman_states["USA"])
+
+    with pytest.raises(ValueError):
+        api.kalman_update_batch(["USA", "USA"], [0.9, 0.1])
+
+    state = api.kalman_states["USA"]
+    assert state["x_hat"] == before["x_hat"]
+    assert state["P"] == before["P"]
+    assert len(state["history"]) == 1
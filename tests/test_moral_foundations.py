@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from moral_foundations import (
+    FOUNDATION_ORDER, STAKEHOLDER_NAMES, STAKEHOLDER_PROFILES, STAKEHOLDER_PROFILE_MATRIX,
+    FeatureIdx, MoralEvaluator, MoralFoundations, PolicyBatch, create_example_policy,
+    stakeholder_weights
+)
+
+SCENARIOS = ["general", "data_privacy", "ethics_board", "transparency"]
+
+
+def random_policies(n, seed=0):
+    rng = np.random.default_rng(seed)
+    policies = []
+    for i in range(n):
+        policy = create_example_policy()
+        policy.policy_id = f"P{i}"
+        for idx in FeatureIdx:
+            setattr(policy, idx.name.lower(), float(rng.random()))
+        policies.append(policy)
+    return policies
+
+
+# The batch paths use BLAS products; the scalar kernels sum term by term
+BATCH_TOLERANCE = 1e-12
+
+
+def scalar_scores(evaluator, policies):
+    return np.array([
+        [evaluator.evaluate_all_foundations(policy)[name] for name in FOUNDATION_ORDER]
+        for policy in policies
+    ])
+
+
+def test_policy_batch_columns_follow_feature_idx():
+    policies = random_policies(5)
+    batch = PolicyBatch.from_features(policies)
+
+    assert batch.features.shape == (5, len(FeatureIdx))
+    assert batch.policy_ids == [policy.policy_id for policy in policies]
+    for row, policy in zip(batch.features, policies):
+        for idx in FeatureIdx:
+            assert row[idx] == getattr(policy, idx.name.lower())
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_evaluate_batch_matches_scalar_evaluation(scenario):
+    evaluator = MoralEvaluator(scenario)
+    policies = random_policies(200) + [create_example_policy()]
+
+    scores = evaluator.evaluate_batch(PolicyBatch.from_features(policies))
+
+    assert scores.shape == (len(policies), len(FOUNDATION_ORDER))
+    np.testing.assert_allclose(scores, scalar_scores(evaluator, policies), rtol=0, atol=BATCH_TOLERANCE)
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_moral_value_matrix_matches_scalar_moral_values(scenario):
+    evaluator = MoralEvaluator(scenario)
+    policies = random_policies(50)
+
+    values = evaluator.compute_moral_value_matrix(PolicyBatch.from_features(policies), STAKEHOLDER_PROFILE_MATRIX)
+
+    expected = [
+        [evaluator.compute_moral_value(policy, STAKEHOLDER_PROFILES[name]) for policy in policies]
+        for name in STAKEHOLDER_NAMES
+    ]
+    np.testing.assert_allclose(values, expected, rtol=0, atol=BATCH_TOLERANCE)
+    for policy, column in zip(policies, values.T):
+        np.testing.assert_allclose(evaluator.compute_moral_values(policy, STAKEHOLDER_PROFILE_MATRIX),
+                                   column, rtol=0, atol=BATCH_TOLERANCE)
+
+
+def test_normalize_matrix_matches_moral_foundations_normalization():
+    weights = np.random.default_rng(2).random((100, 5))
+    weights[0] = 0.0
+    weights[1] = [0.45, 0.35, 0.05, 0.10, 0.05]
+
+    profiles = [MoralFoundations(*row) for row in weights.tolist()]
+
+    np.testing.assert_array_equal(MoralFoundations.normalize_matrix(weights), MoralFoundations.stack(profiles))
+    assert MoralFoundations.from_matrix(weights) == profiles
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_check_admissible_batch_matches_scalar_on_thresholds(scenario):
+    evaluator = MoralEvaluator(scenario)
+    policies = random_policies(120, seed=1)
+    batch = PolicyBatch.from_features(policies)
+
+    # Thresholds sitting exactly on scalar scores are where matmul rounding would flip the result
+    thresholds = [-0.5, -0.6]
+    for policy in policies[:10]:
+        thresholds.extend(evaluator.evaluate_all_foundations(policy).values())
+
+    for threshold in thresholds:
+        admissible = evaluator.check_admissible_batch(batch, STAKEHOLDER_PROFILE_MATRIX, threshold)
+        expected = [
+            [evaluator.check_moral_constraints(policy, stakeholder_weights(name), threshold)[0]
+             for policy in policies]
+            for name in STAKEHOLDER_NAMES
+        ]
+        np.testing.assert_array_equal(admissible, expected)